@@ -1,5 +1,5 @@
 from src.actions.base import BaseAction, ActionSpec, ActionArgument
-from src.backend.query_builder import QueryBuilder
+from src.backend.query_builder import QueryBuilder, row_decoder
 from src.backend.database import DBSessionMixin
 from src.util.db_schema import get_db_query_hint
 from src.util.logging import Logger
@@ -51,19 +51,20 @@ class DBQueryAction(BaseAction, DBSessionMixin):
 
             # Build and execute query
             try:
-                query_builder = self.query_builder.from_spec(query_spec)
-                query = query_builder.build()  # Build the SQLAlchemy query
+                query = self.query_builder.build_spec(query_spec)  # Build the SQLAlchemy query
                 with self.get_session() as session:
                     results = []
                     columns = set()  # Track all columns for table headers
 
                     # First pass: collect all possible columns
+                    decode = None
                     for row in session.execute(query).all():
                         if hasattr(row, "_mapping"):
-                            # Handle SQLAlchemy Result rows
+                            # Handle SQLAlchemy Result rows, which all share the first row's keys
+                            if decode is None:
+                                decode = row_decoder(tuple(row._mapping.keys()))
                             result = {}
-                            for key in row._mapping.keys():
-                                value = row._mapping.get(key)
+                            for key, value in decode(row).items():
                                 # Handle nested objects (e.g. Project.name -> project_name)
                                 if hasattr(value, "__table__"):
                                     for col in value.__table__.columns:
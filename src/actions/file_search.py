@@ -1,6 +1,8 @@
+import re
 from src.actions.base import BaseAction, ActionSpec, ActionArgument
 from src.jobs.file_search import FileSearchJob
-from src.jobs.manager import JobManager
+from src.util.file_search import compile_pattern
+from src.jobs.manager import get_job_manager
 from src.util.logging import Logger
 from src.actions.result import ActionResult
 
@@ -25,6 +27,10 @@ The search will:
 2. Match the regex pattern against file contents
 3. Return matches with context
 
+Matching is case-insensitive. When google-re2 is installed, patterns run on RE2,
+which scans in linear time even on large contracts. Patterns using backreferences
+or lookaround are not supported by RE2 and fall back to the slower Python engine.
+
 Examples:
 /file_search 'function\\s+transfer'           # Search all projects
 /file_search 'function\\s+transfer' 1,2,3     # Search only in projects 1, 2, and 3""",
@@ -46,6 +52,10 @@ Examples:
 
             # First argument is the regex pattern
             regex = args[0]
+            try:
+                pattern = compile_pattern(regex)
+            except re.error as e:
+                return ActionResult.error(f"Invalid regex pattern: {str(e)}")
 
             # Parse project IDs if provided
             project_ids = None
@@ -56,8 +66,8 @@ Examples:
                     return ActionResult.error("Invalid project IDs format. Use comma-separated integers (e.g. '1,2,3')")
 
             # Create and submit the file search job
-            job = FileSearchJob(regex_pattern=regex, project_ids=project_ids)
-            job_manager = JobManager()
+            job = FileSearchJob(regex_pattern=regex, project_ids=project_ids, compiled_pattern=pattern)
+            job_manager = get_job_manager()
             job_id = await job_manager.submit_job(job)
 
             return ActionResult.job(job_id=job_id, metadata={"pattern": regex, "project_ids": project_ids})
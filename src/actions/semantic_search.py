@@ -1,6 +1,6 @@
 from src.actions.base import BaseAction, ActionSpec, ActionArgument
 from src.backend.database import DBSessionMixin
-from src.util.embeddings import generate_embedding
+from src.util.embeddings import generate_embedding, vector_literal
 from sqlalchemy import text
 from src.actions.result import ActionResult
 from src.config.config import Config
@@ -66,17 +66,17 @@ Results are ranked by semantic similarity to your query.""",
                         a.updated_at,
                         p.name as project_name,
                         p.description as project_description,
-                        1 / (1 + (a.embedding <-> array[{','.join(map(str, embedding))}]::vector({dimension}))) as similarity
+                        1 / (1 + (a.embedding <-> CAST(:embedding AS vector({dimension})))) as similarity
                     FROM assets a
                     LEFT JOIN projects p ON a.project_id = p.id
                     WHERE a.embedding IS NOT NULL
-                    ORDER BY a.embedding <-> array[{','.join(map(str, embedding))}]::vector({dimension})
+                    ORDER BY a.embedding <-> CAST(:embedding AS vector({dimension}))
                     LIMIT 10
                     """
                 )
 
                 results = []
-                for row in session.execute(sql):
+                for row in session.execute(sql, {"embedding": vector_literal(embedding)}):
                     # Get URLs from extra_data
                     extra_data = row.extra_data or {}
 
@@ -1,6 +1,6 @@
 from src.actions.base import BaseAction, ActionSpec, ActionArgument
 from src.jobs.indexer import IndexerJob
-from src.jobs.manager import JobManager
+from src.jobs.manager import get_job_manager
 from src.actions.decorators import no_autobot
 from src.actions.result import ActionResult
 
@@ -15,7 +15,7 @@ class ImmunefiSyncAction(BaseAction):
         help_text="""Synchronize bounty program data from Immunefi.
 
 Usage:
-/immunefi [mode]
+/immunefi [mode] [projects]
 
 This command will:
 1. Fetch latest bounty program data
@@ -24,11 +24,13 @@ This command will:
 4. Track changes in scope and rewards
 
 Arguments:
-mode  Sync mode: 'normal' (default) or 'silent' (no notifications)
+mode      Sync mode: 'normal' (default) or 'silent' (no notifications)
+projects  Optional comma-separated project names to sync in one batch
 
 Examples:
-/immunefi         # Regular sync with notifications
-/immunefi silent  # Silent sync for initialization""",
+/immunefi                    # Regular sync with notifications
+/immunefi silent             # Silent sync for initialization
+/immunefi normal Lido,Aave   # Sync only the listed projects""",
         agent_hint="Use this command to update the local database with the latest information from Immunefi bounty programs.",
         arguments=[
             ActionArgument(
@@ -36,6 +38,11 @@ Examples:
                 description="Sync mode: 'normal' or 'silent'",
                 required=False,
             ),
+            ActionArgument(
+                name="projects",
+                description="Comma-separated project names to sync",
+                required=False,
+            ),
         ],
     )
 
@@ -50,10 +57,14 @@ Examples:
         if mode == "silent":
             self.initialize_mode = True
 
-        job = IndexerJob(platform="immunefi", initialize_mode=self.initialize_mode)
-        job_manager = JobManager()
+        # Several projects are synced by a single job sharing one bounty fetch and DB session
+        batch = [name.strip() for name in args[1].split(",") if name.strip()] if len(args) > 1 else None
+
+        job = IndexerJob(platform="immunefi", initialize_mode=self.initialize_mode, batch=batch)
+        job_manager = get_job_manager()
         job_id = await job_manager.submit_job(job)
 
         return ActionResult.job(
-            job_id=job_id, metadata={"platform": "immunefi", "mode": mode, "initialize_mode": self.initialize_mode}
+            job_id=job_id,
+            metadata={"platform": "immunefi", "mode": mode, "initialize_mode": self.initialize_mode, "projects": batch},
         )
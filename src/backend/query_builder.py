@@ -1,11 +1,101 @@
-from typing import Any, Dict, Union, Type
+from typing import Any, Callable, Dict, Sequence, Tuple, Union, Type
 from sqlalchemy import select, and_, text
 from sqlalchemy.sql import Select
 from src.models.base import Asset, Project, Base
 from src.util.logging import Logger
+from functools import lru_cache
+from operator import eq, ne, gt, lt, ge, le
 import json
 
 
+def _as_list(value: Any) -> Union[list, tuple]:
+    return value if isinstance(value, (list, tuple)) else [value]
+
+
+def _ilike(field, value):
+    return field.ilike(value)
+
+
+def _in(field, value):
+    return field.in_(_as_list(value))
+
+
+def _not_in(field, value):
+    return ~field.in_(_as_list(value))
+
+
+def _is_null(field, _):
+    return field.is_(None)
+
+
+def _is_not_null(field, _):
+    return field.isnot(None)
+
+
+def _has_key(field, value):
+    return text(f"{field.key} ? :value").bindparams(value=value)
+
+
+def _has_element(field, value):
+    return text(
+        f"EXISTS (SELECT 1 FROM json_array_elements_text({field.key}::json) as elem WHERE lower(elem) = lower(:value))"
+    ).bindparams(value=value)
+
+
+def _contains_json(field, value):
+    return text(f"CAST({field.key} AS jsonb) @> CAST(:value AS jsonb)").bindparams(value=json.dumps(value))
+
+
+# Operator aliases accepted in where conditions
+OPERATOR_ALIASES = {
+    "like": "ilike",  # Make LIKE case-insensitive by default
+    "equals": "=",
+    "eq": "=",
+    "neq": "!=",
+    "gt": ">",
+    "lt": "<",
+    "gte": ">=",
+    "lte": "<=",
+    "contains": "ilike",
+    "startswith": "ilike",
+    "endswith": "ilike",
+}
+
+# Condition builders for each allowed operator
+OPERATORS = {
+    "=": eq,
+    "!=": ne,
+    ">": gt,
+    "<": lt,
+    ">=": ge,
+    "<=": le,
+    "like": _ilike,
+    "ilike": _ilike,
+    "in": _in,
+    "not in": _not_in,
+    "is null": _is_null,
+    "is not null": _is_not_null,
+    "?": _has_key,
+    "?*": _has_element,
+    "@>": _contains_json,
+}
+
+# Resolved model attributes, shared by all builders
+_COLUMN_CACHE: Dict[Tuple[Type[Base], str], Any] = {}
+
+
+def _col(table: Type[Base], name: str) -> Any:
+    """Get a model attribute by name, caching successful lookups"""
+    key = (table, name)
+    column = _COLUMN_CACHE.get(key)
+    if column is None:
+        column = getattr(table, name, None)
+        if column is None:
+            raise ValueError(f"Field {name} does not exist in {table.__name__}")
+        _COLUMN_CACHE[key] = column
+    return column
+
+
 class QueryBuilder:
     """Safe SQL query builder for assets and projects
 
@@ -66,6 +156,7 @@ class QueryBuilder:
         self._limit = None
         self._offset = None
         self._selected_fields = set()
+        self._field_cache = {}
 
     @classmethod
     def from_spec(cls, spec: Dict[str, Any]) -> "QueryBuilder":
@@ -145,6 +236,21 @@ class QueryBuilder:
 
         return builder
 
+    @classmethod
+    def build_spec(cls, spec: Dict[str, Any]) -> Select:
+        """Build a query from a specification, reusing the statement built for an identical spec
+
+        Statements are immutable, so the cached Select can be shared. Executing the same
+        Select object also hits SQLAlchemy's compiled statement cache, with filter values
+        sent as bound parameters.
+        """
+        try:
+            spec_key = json.dumps(spec, sort_keys=True)
+        except TypeError:
+            # Not JSON-serializable, so it cannot be cached
+            return cls.from_spec(spec).build()
+        return _build_spec_cached(cls, spec_key)
+
     @classmethod
     def example_spec(cls) -> Dict:
         """Return an example query specification"""
@@ -174,8 +280,29 @@ class QueryBuilder:
 
         return self.ALLOWED_TABLES[table_name]
 
+    def _resolve_field(self, field: str):
+        """Resolve a 'table.field' reference (or a base table 'field') to its column"""
+        field_obj = self._field_cache.get(field)
+        if field_obj is not None:
+            return field_obj
+
+        # If field doesn't contain a dot, assume it's from the base table
+        qualified_field = field if "." in field else f"{self._table.__tablename__}.{field}"
+
+        table_name, _, field_name = qualified_field.partition(".")
+        if not table_name or not field_name or "." in field_name:
+            raise ValueError(
+                f"Invalid field format: {qualified_field}. Use format 'table.field' or just 'field' for base table"
+            )
+
+        field_obj = _col(self._get_model_for_table(table_name), field_name)
+        self._field_cache[field] = field_obj
+        return field_obj
+
     def from_table(self, table: Union[str, Type[Base]]) -> "QueryBuilder":
         """Set the base table for the query"""
+        # Unqualified fields resolve against the base table
+        self._field_cache.clear()
         if isinstance(table, str):
             self._table = self._get_model_for_table(table)
         else:
@@ -200,9 +327,10 @@ class QueryBuilder:
         # Build join condition
         join_conditions = []
         for left_field, right_field in on.items():
-            left_col = getattr(self._table, left_field, None)
-            right_col = getattr(join_table, right_field, None)
-            if not left_col or not right_col:
+            try:
+                left_col = _col(self._table, left_field)
+                right_col = _col(join_table, right_field)
+            except ValueError:
                 raise ValueError(f"Invalid join fields: {left_field}, {right_field}")
             join_conditions.append(left_col == right_col)
 
@@ -227,22 +355,7 @@ class QueryBuilder:
                 continue
 
             # Handle normal fields
-            if "." not in field:
-                base_table_name = self._table.__tablename__
-                qualified_field = f"{base_table_name}.{field}"
-                field = qualified_field
-
-            try:
-                table_name, field_name = field.split(".")
-            except ValueError:
-                raise ValueError(f"Invalid field format: {field}. Use format 'table.field' or just 'field' for base table")
-
-            table = self._get_model_for_table(table_name)
-            if not hasattr(table, field_name):
-                raise ValueError(f"Field {field_name} does not exist in {table.__name__}")
-
-            field_obj = getattr(table, field_name)
-            self._selected_fields.add(field_obj)
+            self._selected_fields.add(self._resolve_field(field))
 
         return self
 
@@ -251,47 +364,10 @@ class QueryBuilder:
         if not self._table:
             raise ValueError("No table selected. Call from_table() first.")
 
-        # If field doesn't contain a dot, assume it's from the base table
-        if "." not in field:
-            base_table_name = self._table.__tablename__
-            qualified_field = f"{base_table_name}.{field}"
-            self.logger.debug(f"Qualifying field {field} as {qualified_field}")
-            field = qualified_field
-
-        try:
-            table_name, field_name = field.split(".")
-        except ValueError:
-            raise ValueError(f"Invalid field format: {field}. Use format 'table.field' or just 'field' for base table")
-
-        # Get the table model
-        table = self._get_model_for_table(table_name)
-
-        # Verify field exists
-        if not hasattr(table, field_name):
-            raise ValueError(f"Field {field_name} does not exist in {table.__name__}")
-
-        field_obj = getattr(table, field_name)
-
-        # Normalize operator to lowercase
-        operator = operator.lower()
-
-        # Define operator aliases
-        operator_aliases = {
-            "like": "ilike",  # Make LIKE case-insensitive by default
-            "equals": "=",
-            "eq": "=",
-            "neq": "!=",
-            "gt": ">",
-            "lt": "<",
-            "gte": ">=",
-            "lte": "<=",
-            "contains": "ilike",
-            "startswith": "ilike",
-            "endswith": "ilike",
-        }
+        field_obj = self._resolve_field(field)
 
-        # Resolve operator alias
-        operator = operator_aliases.get(operator, operator)
+        # Normalize operator to lowercase and resolve aliases
+        operator = OPERATOR_ALIASES.get(operator.lower(), operator.lower())
 
         # Modify value based on operator type
         if operator == "startswith":
@@ -301,30 +377,10 @@ class QueryBuilder:
         elif operator in ["like", "ilike", "contains"]:
             value = f"%{value}%"
 
-        allowed_operators = {
-            "=": lambda f, v: f == v,
-            "!=": lambda f, v: f != v,
-            ">": lambda f, v: f > v,
-            "<": lambda f, v: f < v,
-            ">=": lambda f, v: f >= v,
-            "<=": lambda f, v: f <= v,
-            "like": lambda f, v: f.ilike(v),  # Changed to ilike
-            "ilike": lambda f, v: f.ilike(v),
-            "in": lambda f, v: f.in_(v if isinstance(v, (list, tuple)) else [v]),
-            "not in": lambda f, v: ~f.in_(v if isinstance(v, (list, tuple)) else [v]),
-            "is null": lambda f, _: f.is_(None),
-            "is not null": lambda f, _: f.isnot(None),
-            "?": lambda f, v: text(f"{f.key} ? :value").bindparams(value=v),
-            "?*": lambda f, v: text(
-                f"EXISTS (SELECT 1 FROM json_array_elements_text({f.key}::json) as elem WHERE lower(elem) = lower(:value))"
-            ).bindparams(value=v),
-            "@>": lambda f, v: text(f"CAST({f.key} AS jsonb) @> CAST(:value AS jsonb)").bindparams(value=json.dumps(v)),
-        }
-
-        if operator not in allowed_operators:
-            raise ValueError(f"Invalid operator: {operator}. Allowed operators: {', '.join(allowed_operators.keys())}")
+        if operator not in OPERATORS:
+            raise ValueError(f"Invalid operator: {operator}. Allowed operators: {', '.join(OPERATORS.keys())}")
 
-        condition = allowed_operators[operator](field_obj, value)
+        condition = OPERATORS[operator](field_obj, value)
         self._conditions.append(condition)
 
         return self
@@ -345,23 +401,7 @@ class QueryBuilder:
             self._order_by.append(order_clause)
             return self
 
-        # If field doesn't contain a dot, assume it's from the base table
-        if "." not in field:
-            base_table_name = self._table.__tablename__
-            qualified_field = f"{base_table_name}.{field}"
-            self.logger.debug(f"Qualifying field {field} as {qualified_field}")
-            field = qualified_field
-
-        try:
-            table_name, field_name = field.split(".")
-        except ValueError:
-            raise ValueError(f"Invalid field format: {field}. Use format 'table.field' or just 'field' for base table")
-
-        table = self._get_model_for_table(table_name)
-        if not hasattr(table, field_name):
-            raise ValueError(f"Field {field_name} does not exist in {table.__name__}")
-
-        field_obj = getattr(table, field_name)
+        field_obj = self._resolve_field(field)
         self._order_by.append(field_obj.asc() if direction == "asc" else field_obj.desc())
 
         return self
@@ -393,7 +433,7 @@ class QueryBuilder:
             table_name = self._table.__tablename__
             if table_name in self.EXCLUDED_COLUMNS:
                 columns = [
-                    getattr(self._table, c.name)
+                    _col(self._table, c.name)
                     for c in self._table.__table__.columns
                     if c.name not in self.EXCLUDED_COLUMNS[table_name]
                 ]
@@ -464,3 +504,20 @@ class QueryBuilder:
         """Add a raw SQL ORDER BY clause"""
         self._order_by.append(text(clause))
         return self
+
+
+@lru_cache(maxsize=512)
+def _build_spec_cached(builder_class: Type[QueryBuilder], spec_key: str) -> Select:
+    """Build a query from a canonical JSON spec (failed builds are not cached)"""
+    return builder_class.from_spec(json.loads(spec_key)).build()
+
+
+@lru_cache(maxsize=256)
+def row_decoder(keys: Tuple[str, ...]) -> Callable[[Sequence], Dict[str, Any]]:
+    """Compile a function converting result rows with the given keys to dicts
+
+    The keys are baked into a generated dict literal, so decoding a row is a single
+    call with positional lookups instead of a loop over row._mapping.
+    """
+    body = ", ".join(f"{str(key)!r}: row[{i}]" for i, key in enumerate(keys))
+    return eval(compile(f"lambda row: {{{body}}}", "<row_decoder>", "eval"), {})
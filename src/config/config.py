@@ -1,10 +1,24 @@
 import os
 import json
+import asyncio
 import yaml
 from typing import Any, Dict, List, Optional
-from .schema import CONFIG_SCHEMA
+from .schema import CONFIG_SCHEMA, REQUIRED_TOP
 import logging
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+    logging.getLogger("Config").warning(
+        "LibYAML not available, using the slower pure-Python YAML parser. Install libyaml to speed up config loading."
+    )
+
+
+# Marks keys missing from the get() cache (None is a valid cached value)
+_MISSING = object()
+
 
 def _get_nested_value(config: Dict[str, Any], path: str) -> Any:
     """Get a nested value from a dictionary using dot notation."""
@@ -34,6 +48,19 @@ def _set_nested_value(config: Dict[str, Any], path: str, value: Any) -> None:
     current[keys[-1]] = value
 
 
+def _merge_configs(base: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Deep-merge update into base in place, using an explicit stack instead of recursion."""
+    stack = [(base, update)]
+    while stack:
+        current, updates = stack.pop()
+        for key, value in updates.items():
+            existing = current.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                stack.append((existing, value))
+            else:
+                current[key] = value
+
+
 def _convert_value(value: str, value_type: str) -> Any:
     """Convert string value to the specified type."""
     if value_type == "bool":
@@ -68,6 +95,15 @@ def _get_schema_type(path: str) -> str:
     return "string"
 
 
+def _read_file(path: str) -> Optional[str]:
+    """Read a file's contents, returning None if it doesn't exist."""
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
 def load_config(config_path: str, test_mode: bool = False) -> Dict[str, Any]:
     """Load configuration from file and environment"""
     logger = logging.getLogger("Config")
@@ -80,7 +116,7 @@ def load_config(config_path: str, test_mode: bool = False) -> Dict[str, Any]:
         with open(config_path, "r") as f:
             content = f.read()
             try:
-                loaded = yaml.safe_load(content)
+                loaded = yaml.load(content, Loader=_SafeLoader)
                 if loaded is not None:
                     # Update nested dictionaries instead of replacing them
                     for key, value in loaded.items():
@@ -166,6 +202,7 @@ class Config:
     _instance = None
     _config = None
     _test_mode = False
+    _get_cache: Dict[str, Any] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -183,6 +220,12 @@ class Config:
         # Get config path from environment or use default
         config_path = os.environ.get("Legion_CONFIG", "config.yml")
         Config._config = load_config(config_path, test_mode=Config._test_mode)
+        Config._get_cache.clear()
+
+        # Cheap preflight for the most common misconfiguration
+        missing = REQUIRED_TOP - Config._config.keys()
+        if missing:
+            logging.getLogger("Config").warning(f"Missing required config sections: {', '.join(sorted(missing))}")
 
     def load_extension_config(self, config_path: str) -> None:
         """Load extension-specific configuration and merge it with the main config"""
@@ -190,17 +233,27 @@ class Config:
             return
 
         with open(config_path, "r") as f:
-            try:
-                extension_config = yaml.safe_load(f)
-                if extension_config and isinstance(extension_config, dict):
-                    # Merge extension config with main config
-                    for key, value in extension_config.items():
-                        if isinstance(value, dict) and key in Config._config and isinstance(Config._config[key], dict):
-                            Config._config[key].update(value)
-                        else:
-                            Config._config[key] = value
-            except yaml.YAMLError as e:
-                logging.getLogger("Config").error(f"Failed to load extension config {config_path}: {e}")
+            self._merge_extension_config(config_path, f.read())
+
+    async def load_extension_configs(self, config_paths: List[str]) -> None:
+        """Load several extension configs concurrently and merge them in the given order"""
+        contents = await asyncio.gather(*[asyncio.to_thread(_read_file, path) for path in config_paths])
+
+        # Merge sequentially so later paths override earlier ones reproducibly
+        for config_path, content in zip(config_paths, contents):
+            if content is not None:
+                self._merge_extension_config(config_path, content)
+
+    def _merge_extension_config(self, config_path: str, content: str) -> None:
+        """Parse an extension config and merge it with the main config"""
+        try:
+            extension_config = yaml.load(content, Loader=_SafeLoader)
+            if extension_config and isinstance(extension_config, dict):
+                # Merge extension config with main config
+                _merge_configs(Config._config, extension_config)
+                Config._get_cache.clear()
+        except yaml.YAMLError as e:
+            logging.getLogger("Config").error(f"Failed to load extension config {config_path}: {e}")
 
     @classmethod
     def set_test_mode(cls, enabled: bool = True):
@@ -209,12 +262,17 @@ class Config:
         # Reset config when changing test mode
         cls._config = None
         cls._instance = None
+        cls._get_cache.clear()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
         if not Config._config:
             return default
-        value = _get_nested_value(Config._config, key)
+        # Dotted lookups are cached until the config is reloaded or extended
+        value = Config._get_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = _get_nested_value(Config._config, key)
+            Config._get_cache[key] = value
         return value if value is not None else default
 
     @property
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Environment variable mappings for config values
 ENV_MAPPINGS = {
     "data_dir": "LEGION_DATA_DIR",
@@ -23,7 +25,7 @@ ENV_MAPPINGS = {
     "webhook_server.port": {"env": "LEGION_WEBHOOK_PORT", "type": "int"},
 }
 
-CONFIG_SCHEMA = {
+_CONFIG_SCHEMA = {
     "type": "object",
     "properties": {
         "database": {
@@ -129,3 +131,21 @@ CONFIG_SCHEMA = {
     },
     "required": ["database", "data_dir"],
 }
+
+
+def _freeze(value):
+    """Recursively convert dicts and lists into read-only mappings and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Frozen so lookups can't accidentally mutate the schema
+CONFIG_SCHEMA = _freeze(_CONFIG_SCHEMA)
+del _CONFIG_SCHEMA
+
+# Derived key sets, computed once
+REQUIRED_TOP = frozenset(CONFIG_SCHEMA["required"])
+KNOWN_TOP = frozenset(CONFIG_SCHEMA["properties"])
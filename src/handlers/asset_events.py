@@ -11,6 +11,8 @@ from datetime import datetime
 class AssetEventHandler(Handler):
     """Handler for asset-related events"""
 
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         self.logger = Logger("AssetEventHandler")
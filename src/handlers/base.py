@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from typing import Dict, Any, List, Optional
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -43,11 +44,36 @@ class HandlerTrigger(Enum):
 
 
 class Handler(ABC):
-    """Base class for event handlers"""
+    """Base class for event handlers
+
+    Handlers that keep no per-event state other than context and trigger can set
+    REUSABLE = True, letting the event bus share one instance across events. Context
+    and trigger are stored in context variables, so concurrent handle() calls on the
+    same instance each see the values set in their own task.
+    """
+
+    REUSABLE = False
 
     def __init__(self):
-        self.context = {}
-        self.trigger = None
+        name = type(self).__name__
+        self._context: ContextVar[Dict[str, Any]] = ContextVar(f"{name}.context", default={})
+        self._trigger: ContextVar[Optional[HandlerTrigger]] = ContextVar(f"{name}.trigger", default=None)
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        return self._context.get()
+
+    @context.setter
+    def context(self, context: Dict[str, Any]) -> None:
+        self._context.set(context)
+
+    @property
+    def trigger(self) -> Optional[HandlerTrigger]:
+        return self._trigger.get()
+
+    @trigger.setter
+    def trigger(self, trigger: Optional[HandlerTrigger]) -> None:
+        self._trigger.set(trigger)
 
     @classmethod
     @abstractmethod
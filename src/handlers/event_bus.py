@@ -1,5 +1,6 @@
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 import asyncio
+import os
 from src.handlers.base import Handler, HandlerTrigger
 from src.util.logging import Logger
 from src.backend.database import DBSessionMixin
@@ -19,6 +20,9 @@ class EventBus(DBSessionMixin):
     def initialize(self):
         self.logger = Logger("EventBus")
         self._handlers: Dict[HandlerTrigger, List[Type[Handler]]] = {}
+        self._instances: Dict[Type[Handler], Handler] = {}
+        # Bound how many handlers run at once so bursts of events don't flood the loop
+        self._fanout = asyncio.Semaphore(int(os.getenv("EVENT_BUS_FANOUT", "32")))
 
     def register_handler(self, handler_class: Type[Handler]) -> None:
         """Register a handler for specific triggers"""
@@ -30,26 +34,34 @@ class EventBus(DBSessionMixin):
 
     async def trigger_event(self, trigger: HandlerTrigger, context: Dict) -> None:
         """Trigger handlers for a specific event"""
-        if trigger not in self._handlers:
-            self.logger.warning(f"No handlers registered for trigger {trigger.name}")
-            return
+        await self.trigger_events([(trigger, context)])
 
-        self.logger.info(f"Triggering {len(self._handlers[trigger])} handlers for {trigger.name}")
+    async def trigger_events(self, batch: List[Tuple[HandlerTrigger, Dict]]) -> None:
+        """Trigger handlers for a batch of events, awaiting all of them together"""
+        grouped: Dict[HandlerTrigger, List[Dict]] = {}
+        for trigger, context in batch:
+            grouped.setdefault(trigger, []).append(context)
 
         handler_tasks = []
-        for handler_class in self._handlers[trigger]:
-            try:
-                self.logger.debug(f"Creating handler instance for {handler_class.__name__}")
-                handler = handler_class()
-                handler.set_context(context, trigger)
-                # Create coroutine and add to tasks
-                task = asyncio.create_task(self._execute_handler(handler, trigger))
-                handler_tasks.append(task)
-            except Exception as e:
-                self.logger.error(
-                    f"Handler {handler_class.__name__} failed: {str(e)}",
-                    extra_data={"trigger": trigger.name, "context": context},
-                )
+        for trigger, contexts in grouped.items():
+            if trigger not in self._handlers:
+                self.logger.warning(f"No handlers registered for trigger {trigger.name}")
+                continue
+
+            self.logger.info(f"Triggering {len(self._handlers[trigger])} handlers for {len(contexts)} {trigger.name} event(s)")
+
+            for handler_class in self._handlers[trigger]:
+                for context in contexts:
+                    try:
+                        handler = self._get_handler(handler_class)
+                        # Create coroutine and add to tasks
+                        task = asyncio.create_task(self._execute_handler(handler, trigger, context))
+                        handler_tasks.append(task)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Handler {handler_class.__name__} failed: {str(e)}",
+                            extra_data={"trigger": trigger.name, "context": context},
+                        )
 
         # Wait for all handlers to complete
         if handler_tasks:
@@ -58,12 +70,25 @@ class EventBus(DBSessionMixin):
             except Exception as e:
                 self.logger.error(f"Error in handler execution: {str(e)}")
 
-    async def _execute_handler(self, handler: Handler, trigger: HandlerTrigger) -> None:
+    def _get_handler(self, handler_class: Type[Handler]) -> Handler:
+        """Get a handler instance, reusing a cached one for reusable handlers"""
+        handler = self._instances.get(handler_class)
+        if handler is None:
+            self.logger.debug(f"Creating handler instance for {handler_class.__name__}")
+            handler = handler_class()
+            if handler_class.REUSABLE:
+                self._instances[handler_class] = handler
+        return handler
+
+    async def _execute_handler(self, handler: Handler, trigger: HandlerTrigger, context: Dict) -> None:
         """Execute a handler and log the result"""
-        try:
-            self.logger.debug(f"Starting handler execution: {handler.__class__.__name__}")
-            result = await handler.handle()
-            self.logger.debug(f"Handler execution completed: {handler.__class__.__name__}, result: {result}")
+        async with self._fanout:
+            try:
+                # Set inside the task so each execution has its own context
+                handler.set_context(context, trigger)
+                self.logger.debug(f"Starting handler execution: {handler.__class__.__name__}")
+                result = await handler.handle()
+                self.logger.debug(f"Handler execution completed: {handler.__class__.__name__}, result: {result}")
 
-        except Exception as e:
-            self.logger.error(f"Handler execution failed: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"Handler execution failed: {str(e)}")
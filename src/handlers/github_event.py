@@ -20,6 +20,8 @@ Be concise and direct in your analysis."""
 class GitHubEventHandler(Handler, DBSessionMixin):
     """Handler for GitHub events (PR and push)"""
 
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         self.logger = Logger("GitHubEventHandler")
@@ -8,6 +8,8 @@ from src.models.base import Project
 class ProjectEventHandler(Handler):
     """Handler for project-related events"""
 
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         self.logger = Logger("ProjectEventHandler")
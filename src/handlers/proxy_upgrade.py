@@ -23,6 +23,8 @@ Be concise and direct in your analysis."""
 class ProxyUpgradeHandler(Handler):
     """Handler for proxy contract implementation upgrades"""
 
+    REUSABLE = True
+
     def __init__(self):
         super().__init__()
         self.logger = Logger("ProxyUpgradeHandler")
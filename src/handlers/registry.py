@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict, List, Tuple, Type
 from src.handlers.base import Handler, HandlerTrigger
 from src.util.logging import Logger
 from src.handlers.event_bus import EventBus
@@ -39,3 +39,7 @@ class HandlerRegistry:
     async def trigger_event(self, trigger: HandlerTrigger, context: Dict) -> None:
         """Trigger handlers for a specific event"""
         await self.event_bus.trigger_event(trigger, context)
+
+    async def trigger_events(self, batch: List[Tuple[HandlerTrigger, Dict]]) -> None:
+        """Trigger handlers for a batch of events"""
+        await self.event_bus.trigger_events(batch)
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from src.backend.asset_storage import AssetStorage
 from sqlalchemy import text
+from typing import List, Optional
 
 
 def _serialize_datetime(obj):
@@ -101,12 +102,19 @@ class ImmunefiIndexer:
                 serialized_data = _serialize_event_data(event_data)
                 await self.handler_registry.trigger_event(event_type, serialized_data)
 
+    async def trigger_events(self, event_type: HandlerTrigger, events: list):
+        """Safely trigger a batch of events of the same type with serialized data."""
+        if not self.initialize_mode and self.handler_registry:
+            if event_type not in [HandlerTrigger.NEW_ASSET, HandlerTrigger.ASSET_UPDATE]:
+                events = [_serialize_event_data(event_data) for event_data in events]
+            await self.handler_registry.trigger_events([(event_type, event_data) for event_data in events])
+
     def stop(self):
         """Signal the indexer to stop"""
         self._stop_event.set()
 
-    async def index(self):
-        """Fetch and index bounties"""
+    async def index(self, projects: Optional[List[str]] = None):
+        """Fetch and index bounties, optionally limited to the named projects"""
         try:
             url = self.config.get("api", {}).get("immunefi", {}).get("url", "https://immunefi.com/public-api/bounties.json")
 
@@ -138,16 +146,25 @@ class ImmunefiIndexer:
             # Track current project names
             current_projects = {project["project"] for project in bounty_data if "project" in project}
 
+            # Restrict to the requested projects, if any
+            to_process = bounty_data
+            if projects:
+                targets = set(projects)
+                to_process = [project for project in bounty_data if project.get("project") in targets]
+                for name in sorted(targets - current_projects):
+                    self.logger.warning(f"Project {name} is not listed in Immunefi")
+
             # Process all current projects
-            for project_data in bounty_data:
+            for project_data in to_process:
                 if self._stop_event.is_set():
                     self.logger.info("Indexing stopped by request")
                     break
 
                 await self.process_bounty(project_data)
 
-            # Clean up removed projects
-            await self.cleanup_removed_projects(current_projects)
+            # Clean up removed projects (a partial sync can't tell what was removed)
+            if not projects:
+                await self.cleanup_removed_projects(current_projects)
 
         except Exception as e:
             self.logger.error(f"Failed to index Immunefi: {str(e)}")
@@ -186,10 +203,13 @@ class ImmunefiIndexer:
                             else:
                                 await self._remove_file(asset.local_path)
 
-                        # Trigger event for asset removal
-                        await self.trigger_event(HandlerTrigger.ASSET_REMOVE, {"asset": asset, "project": project})
+                    # Trigger asset removal events as one batch
+                    await self.trigger_events(
+                        HandlerTrigger.ASSET_REMOVE, [{"asset": asset, "project": project} for asset in project.assets]
+                    )
 
-                        # Delete asset from database
+                    # Delete assets from database
+                    for asset in project.assets:
                         self.session.delete(asset)
 
                     # Trigger project removal event
@@ -1,6 +1,7 @@
 """Job that runs an agent with a custom prompt"""
 
 from datetime import datetime
+import time
 from src.jobs.base import Job, JobResult
 from src.ai.chatbot import Chatbot
 from src.actions.result import ActionResult
@@ -24,6 +25,8 @@ class AutobotJob(Job):
         pass  # Nothing special needed for cleanup
 
     async def run(self) -> None:
+        # Measure duration on the monotonic clock, which wall-clock adjustments cannot skew
+        run_started = time.monotonic()
         try:
             # Process message and track results - no update_callback needed
             result = await self.chatbot.process_message(self.prompt, action_callback=self._track_action_result)
@@ -34,7 +37,7 @@ class AutobotJob(Job):
                 message="Autobot completed successfully",
                 data={
                     "history": self.chatbot.history[1:],
-                    "execution_time": (datetime.utcnow() - self.started_at).total_seconds(),
+                    "execution_time": time.monotonic() - run_started,
                     "action_results": self.action_results,
                     "final_result": result,
                 },
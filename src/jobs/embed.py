@@ -3,19 +3,44 @@
 from src.jobs.base import Job, JobResult
 from src.backend.database import DBSessionMixin
 from src.models.base import Asset
-from src.util.embeddings import update_asset_embedding
+from src.util.embeddings import batch_update_asset_embeddings, vector_literal
 from src.util.logging import Logger
 from sqlalchemy import select, text
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
 from datetime import datetime
-from sqlalchemy.orm import joinedload
-from asyncio import sleep
+from sqlalchemy.orm import selectinload
+import asyncio
+import logging
+import numpy as np
 from src.config.config import Config
 
 
+def _batch_update_query(embeddings: List[Tuple[int, List[float]]], dimension: int) -> Tuple[Any, Dict[str, Any]]:
+    """Build a single UPDATE setting the embeddings of several assets from bound parameters"""
+    rows = []
+    params = {}
+    for i, (asset_id, embedding) in enumerate(embeddings):
+        rows.append(f"(CAST(:id{i} AS integer), CAST(:emb{i} AS text))")
+        params[f"id{i}"] = asset_id
+        params[f"emb{i}"] = vector_literal(embedding)
+
+    query = text(
+        f"""
+        UPDATE assets
+        SET embedding = CAST(v.emb AS vector({int(dimension)}))
+        FROM (VALUES {", ".join(rows)}) AS v(id, emb)
+        WHERE assets.id = v.id
+        """
+    )
+    return query, params
+
+
 class EmbedJob(Job, DBSessionMixin):
     """Job to generate embeddings for all assets in the database"""
 
-    BATCH_SIZE = 10  # Commit every 10 assets
+    BATCH_SIZE = 10  # Embed, update and commit 10 assets at a time
+    PIPELINE_DEPTH = 2  # Embedded batches waiting to be written
+    UNIQUE_SAMPLE_SIZE = 128  # Leading values checked for diversity
 
     def __init__(self):
         Job.__init__(self, "embed")
@@ -34,84 +59,29 @@ class EmbedJob(Job, DBSessionMixin):
             dimension = self.config.embeddings_dimension
             self.logger.info(f"Starting embedding generation using model: {model}")
 
-            async with self.get_async_session() as session:
-                # Get all assets with their projects eagerly loaded
-                query = select(Asset).options(joinedload(Asset.project))
-                result = await session.execute(query)
-                assets = result.scalars().all()
-
-                total = len(assets)
-                self.logger.info(f"Found {total} assets to process")
-
-                # Process assets in batches
-                current_batch = []
-                for i, asset in enumerate(assets):
-                    try:
-                        self.logger.info(f"Processing asset {asset.id} ({i+1}/{total})")
-
-                        # Yield control periodically
-                        if i % 5 == 0:  # Every 5 assets
-                            await sleep(0.1)
-
-                        # Generate embedding directly from asset
-                        embedding = await update_asset_embedding(asset)
-
-                        # Add debug logging for embedding quality checks
-                        if embedding:
-                            self.logger.info(f"Generated embedding of length {len(embedding)}")
-                            self.logger.info(f"Sample values: {embedding[:5]}")
-                            self.logger.info(
-                                f"Stats - min: {min(embedding):.4f}, max: {max(embedding):.4f}, mean: {sum(embedding)/len(embedding):.4f}"
-                            )
-
-                            # Check for zero vectors or constant values
-                            unique_values = len(set(embedding))
-                            self.logger.info(f"Number of unique values: {unique_values}")
-                            if unique_values < 10:
-                                self.logger.warning("Warning: Very few unique values in embedding!")
-                        else:
-                            self.logger.warning(f"Empty embedding generated for asset {asset.id}")
-                            continue
-
-                        # Format the embedding array properly for PostgreSQL
-                        embedding_str = ",".join(str(x) for x in embedding)
-
-                        # Update embedding using native PostgreSQL array casting
-                        update_query = text(
-                            f"""
-                            UPDATE assets
-                            SET embedding = array[%s]::vector({dimension})
-                            WHERE id = :id
-                            """
-                            % embedding_str
-                        )
-                        await session.execute(update_query, {"id": asset.id})
-
-                        self.processed += 1
-                        current_batch.append(asset.id)
-
-                        # Only commit on full batch or last asset
-                        should_commit = len(current_batch) >= self.BATCH_SIZE or i == total - 1
-                        if should_commit and current_batch:
-                            self.logger.info(f"Committing batch of {len(current_batch)} assets: {current_batch}")
-                            try:
-                                await session.commit()
-                                self._commit_count += 1
-                                self.logger.info(f"Commit #{self._commit_count} successful")
-                                current_batch = []  # Clear batch after successful commit
-                                await sleep(0.1)  # Yield after each commit
-                            except Exception as e:
-                                self.logger.error(f"Failed to commit batch: {str(e)}")
-                                await session.rollback()
-                                raise
-
-                    except Exception as e:
-                        self.failed += 1
-                        self.logger.error(f"Failed to generate embedding for asset {asset.id}: {str(e)}")
-                        if "Database error" in str(e):
-                            session.rollback()
-                            raise
-                        session.rollback()
+            # Commits end the read transaction, so assets are streamed through a session of their own
+            async with self.get_async_session() as read_session, self.get_async_session() as session:
+                # Stream assets one batch per fetch; the embedding text uses each asset's project, which is
+                # loaded with one IN query per batch rather than joined onto every asset row
+                query = select(Asset).options(selectinload(Asset.project)).execution_options(yield_per=self.BATCH_SIZE)
+                result = await read_session.stream(query)
+                self.logger.info(f"Streaming assets to process in batches of {self.BATCH_SIZE}")
+
+                # Generate the next batch while the previous one is written; if either side fails, the other
+                # is cancelled so it cannot wait forever on the queue, and the error fails the job
+                queue = asyncio.Queue(maxsize=self.PIPELINE_DEPTH)
+                tasks = [
+                    asyncio.create_task(self._produce_embeddings(result.scalars().partitions(), queue)),
+                    asyncio.create_task(self._write_embeddings(session, queue, dimension)),
+                ]
+                try:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                for task in done:
+                    task.result()
 
             # Create result with success/failure stats
             result = JobResult(
@@ -131,6 +101,72 @@ class EmbedJob(Job, DBSessionMixin):
             self.logger.error(f"Embedding job failed: {str(e)}")
             await self.fail(str(e))
 
+    async def _produce_embeddings(self, batches: AsyncIterator[Sequence[Asset]], queue: asyncio.Queue) -> None:
+        """Generate embeddings batch by batch and queue them for writing, ending with None"""
+        start = 0
+        async for batch in batches:
+            self.logger.info(f"Processing assets {start+1}-{start+len(batch)}")
+            start += len(batch)
+
+            try:
+                # Generate embeddings for the whole batch in one model call
+                embeddings = await batch_update_asset_embeddings(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                self.logger.error(f"Failed to generate embeddings for assets {[a.id for a in batch]}: {str(e)}")
+                continue
+
+            # Assets skipped for lack of text count as failed
+            self.failed += len(batch) - len(embeddings)
+
+            # Add debug logging for embedding quality checks
+            if self.logger.python_logger.isEnabledFor(logging.DEBUG):
+                for asset_id, embedding in embeddings:
+                    self._log_embedding_stats(asset_id, embedding)
+
+            if embeddings:
+                await queue.put(embeddings)
+
+        await queue.put(None)
+
+    async def _write_embeddings(self, session: Any, queue: asyncio.Queue, dimension: int) -> None:
+        """Write queued embedding batches, one UPDATE and commit each, until the producer is done"""
+        while (embeddings := await queue.get()) is not None:
+            asset_ids = [asset_id for asset_id, _ in embeddings]
+            try:
+                # Update all embeddings in the batch with one statement
+                update_query, params = _batch_update_query(embeddings, dimension)
+                await session.execute(update_query, params)
+
+                self.logger.info(f"Committing batch of {len(asset_ids)} assets: {asset_ids}")
+                await session.commit()
+                self._commit_count += 1
+                self.processed += len(embeddings)
+                self.logger.info(f"Commit #{self._commit_count} successful")
+
+            except Exception as e:
+                self.failed += len(embeddings)
+                self.logger.error(f"Failed to store embeddings for assets {asset_ids}: {str(e)}")
+                await session.rollback()
+                if "Database error" in str(e):
+                    raise
+
+    def _log_embedding_stats(self, asset_id: int, embedding: List[float]) -> None:
+        """Log summary statistics for an embedding in a single vectorized pass"""
+        arr = np.asarray(embedding, dtype=np.float32)
+        self.logger.debug(f"Generated embedding of length {arr.size} for asset {asset_id}")
+        if arr.size == 0:
+            self.logger.warning(f"Warning: Empty embedding for asset {asset_id}!")
+            return
+        self.logger.debug(f"Sample values: {embedding[:5]}")
+        self.logger.debug(f"Stats - min: {arr.min():.4f}, max: {arr.max():.4f}, mean: {arr.mean():.4f}")
+
+        # Check for zero vectors or constant values on a leading sample, which is enough to spot degenerate output
+        unique_values = np.unique(arr[: self.UNIQUE_SAMPLE_SIZE]).size
+        self.logger.debug(f"Number of unique values in first {self.UNIQUE_SAMPLE_SIZE}: {unique_values}")
+        if unique_values < 10:
+            self.logger.warning("Warning: Very few unique values in embedding!")
+
     async def stop_handler(self) -> None:
         """Handle job stop request"""
         self.logger.info("Stopping embedding job")
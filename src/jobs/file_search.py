@@ -1,28 +1,16 @@
 from src.jobs.base import Job, JobResult
 from src.backend.database import DBSessionMixin
+from src.util.file_search import compile_pattern, search_shard
 from src.util.logging import Logger
+import multiprocessing
 import os
-import re
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple
 from src.models.base import Asset
 import asyncio
 from src.config.config import Config
 
 
-def is_binary_file(file_path: str) -> bool:
-    """Check if a file is binary by reading its first few bytes"""
-    try:
-        with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-            if not chunk:  # Empty file
-                return False
-            # Check for null bytes and high concentration of non-text bytes
-            textchars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
-            return bool(chunk.translate(None, textchars))
-    except Exception:
-        return True
-
-
 class FileSearchJob(Job, DBSessionMixin):
     """Job to search local files using regex and retrieve associated asset info"""
 
@@ -58,12 +46,16 @@ class FileSearchJob(Job, DBSessionMixin):
         ".lockb",  # Lock files
     }
 
-    def __init__(self, regex_pattern: str, project_ids: List[int] = None):
+    # Target number of bytes searched by a single worker task
+    SHARD_SIZE = 64 << 20
+
+    def __init__(self, regex_pattern: str, project_ids: List[int] = None, compiled_pattern=None):
         """Initialize the file search job
 
         Args:
             regex_pattern: Regular expression pattern to search for
             project_ids: Optional list of project IDs to filter by
+            compiled_pattern: Optional precompiled form of regex_pattern
         """
         # Initialize base Job class
         super().__init__(job_type="file_search")
@@ -72,7 +64,7 @@ class FileSearchJob(Job, DBSessionMixin):
 
         # Store pattern and project IDs in config
         self.config = {"pattern": regex_pattern, "project_ids": project_ids}
-        self.pattern = re.compile(regex_pattern, re.IGNORECASE | re.MULTILINE)
+        self.pattern = compiled_pattern or compile_pattern(regex_pattern)
 
         # Get allowed extensions from config
         config = Config()
@@ -89,66 +81,68 @@ class FileSearchJob(Job, DBSessionMixin):
         # Skip if extension is in skip list or if we have allowed extensions and this isn't one of them
         return ext in self.SKIP_EXTENSIONS or (self.allowed_extensions and ext not in self.allowed_extensions)
 
-    def _search_file(self, file_path: str, pattern: re.Pattern) -> List[Dict]:
-        """Search a single file for regex matches"""
-        try:
-            # Skip binary and known binary extensions
-            if self._should_skip_file(file_path) or is_binary_file(file_path):
-                return []
-
-            # Read file content
-            with open(file_path, "r") as f:
-                content = f.read()
-
-            # Use finditer to get non-overlapping matches with positions
-            matches = list(pattern.finditer(content))
-            file_matches = []
-
-            for match in matches:
-                self.logger.debug(f"Match: {match.group(0)}")
-                # Get some context around the match
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 50)
-                context = content[start:end]
-
-                # Get the match info - we want to match any occurrence of the pattern
-                match_info = {"match": match.group(0), "context": context, "start": match.start(), "end": match.end()}
-                file_matches.append(match_info)
-
-            return file_matches
-
-        except Exception as e:
-            self.logger.error(f"Error searching file {file_path}: {str(e)}")
-            return []
-
-    def _search_directory(self, directory: str, pattern: re.Pattern) -> List[Dict]:
-        """Recursively search a directory for regex matches"""
-        matches = []
+    def _collect_files(self, directory: str) -> List[Tuple[str, int]]:
+        """Recursively collect searchable files in a directory with their sizes"""
+        files = []
         try:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
+            for root, _, names in os.walk(directory):
+                for name in names:
+                    file_path = os.path.join(root, name)
+                    if self._should_skip_file(file_path):
+                        continue
                     try:
-                        file_matches = self._search_file(file_path, pattern)
-                        if file_matches:
-                            matches.append({"file_path": file_path, "matches": file_matches})
-                    except Exception as e:
+                        files.append((file_path, os.path.getsize(file_path)))
+                    except OSError as e:
                         self.logger.error(f"Error processing file {file_path}: {str(e)}")
-                        continue
         except Exception as e:
             self.logger.error(f"Error searching directory {directory}: {str(e)}")
             return []
-        return matches
+        return files
+
+    def _partition_files(self, files: List[Tuple[str, int]]) -> List[List[str]]:
+        """Split files into shards of roughly SHARD_SIZE bytes each"""
+        shards = []
+        current, current_size = [], 0
+        for file_path, size in files:
+            current.append(file_path)
+            current_size += size
+            if current_size >= self.SHARD_SIZE:
+                shards.append(current)
+                current, current_size = [], 0
+        if current:
+            shards.append(current)
+        return shards
+
+    async def _search_files(self, files: List[Tuple[str, int]]) -> Dict[str, List[Dict]]:
+        """Search files across a process pool, returning matches keyed by file path"""
+        shards = self._partition_files(files)
+        if not shards:
+            return {}
 
-    async def _search_file_async(self, file_path: str, pattern: re.Pattern) -> List[Dict]:
-        """Search a single file for regex matches asynchronously"""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._search_file, file_path, pattern)
-
-    async def _search_directory_async(self, directory: str, pattern: re.Pattern) -> List[Dict]:
-        """Recursively search a directory for regex matches asynchronously"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._search_directory, directory, pattern)
+        if len(shards) == 1:
+            # Not worth spinning up worker processes for a single shard
+            shard_results = [await loop.run_in_executor(None, search_shard, self.config["pattern"], shards[0], self.pattern)]
+        else:
+            max_workers = min(len(shards), os.cpu_count() or 1)
+            self.logger.info(f"Searching {len(files)} files in {len(shards)} shards using {max_workers} workers")
+            # Forking this multithreaded process could copy held locks into the workers, so use a fork server
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("forkserver"))
+            try:
+                shard_results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, search_shard, self.config["pattern"], shard) for shard in shards)
+                )
+            except BaseException:
+                # Cancelled or failed: drop queued shards rather than blocking the event loop on them
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            await loop.run_in_executor(None, pool.shutdown)
+
+        matches = {}
+        for results in shard_results:
+            for file_path, file_matches in results:
+                matches.setdefault(file_path, file_matches)
+        return matches
 
     async def start(self) -> None:
         """Start the file search job"""
@@ -176,31 +170,40 @@ class FileSearchJob(Job, DBSessionMixin):
                 assets = query.all()
                 self.logger.info(f"Searching {len(assets)} assets")
 
-                # Search each asset
+                # Collect files for every asset, searching each file only once
+                loop = asyncio.get_running_loop()
+                asset_files = []
+                files_by_path = {}
                 for asset in assets:
                     # Skip if no local path
                     if not asset.local_path:
                         continue
 
-                    # Search the asset
-                    try:
-                        asset_matches = await self._search_directory_async(asset.local_path, self.pattern)
-                        if asset_matches:
-                            results.append(
-                                {
-                                    "asset": {
-                                        "id": asset.id,
-                                        "source_url": asset.source_url,
-                                        "asset_type": asset.asset_type,
-                                        "project": asset.project.name if asset.project else None,
-                                    },
-                                    "matches": asset_matches,
-                                }
-                            )
-                            total_matches += sum(len(m["matches"]) for m in asset_matches)
-                    except Exception as e:
-                        self.logger.error(f"Error searching asset {asset.local_path}: {str(e)}")
-                        continue
+                    files = await loop.run_in_executor(None, self._collect_files, asset.local_path)
+                    asset_files.append((asset, [file_path for file_path, _ in files]))
+                    files_by_path.update(files)
+
+                matches_by_path = await self._search_files(list(files_by_path.items()))
+
+                for asset, file_paths in asset_files:
+                    asset_matches = [
+                        {"file_path": file_path, "matches": matches_by_path[file_path]}
+                        for file_path in file_paths
+                        if file_path in matches_by_path
+                    ]
+                    if asset_matches:
+                        results.append(
+                            {
+                                "asset": {
+                                    "id": asset.id,
+                                    "source_url": asset.source_url,
+                                    "asset_type": asset.asset_type,
+                                    "project": asset.project.name if asset.project else None,
+                                },
+                                "matches": asset_matches,
+                            }
+                        )
+                        total_matches += sum(len(m["matches"]) for m in asset_matches)
 
             # Create result
             result = JobResult(
@@ -3,16 +3,18 @@ from src.jobs.base import Job, JobResult, JobStatus
 from src.indexers.immunefi import ImmunefiIndexer
 from src.backend.database import DBSessionMixin
 import threading
+from typing import List, Optional
 
 
 class IndexerJob(Job, DBSessionMixin):
     """Job to run an indexer"""
 
-    def __init__(self, platform: str, initialize_mode: bool = False):
+    def __init__(self, platform: str, initialize_mode: bool = False, batch: Optional[List[str]] = None):
         Job.__init__(self, "indexer")
         DBSessionMixin.__init__(self)
         self.platform = platform
         self.initialize_mode = initialize_mode
+        self.batch = batch  # Optional project names to limit the sync to
         self._stop_event = threading.Event()
         self._executor = None
         self._task = None
@@ -28,7 +30,7 @@ class IndexerJob(Job, DBSessionMixin):
                     indexer = ImmunefiIndexer(session=session, initialize_mode=self.initialize_mode)
                     # Pass stop event to indexer
                     indexer._stop_event = self._stop_event
-                    await indexer.index()
+                    await indexer.index(projects=self.batch)
 
                     await self.complete(JobResult(success=True, message=f"Successfully indexed {self.platform}"))
                 else:
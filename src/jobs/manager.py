@@ -16,6 +16,8 @@ class JobManager(DBSessionMixin):
     _instance = None
     _lock = asyncio.Lock()
 
+    STOP_TIMEOUT = 10  # Seconds to wait for cancelled jobs during shutdown
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(JobManager, cls).__new__(cls)
@@ -56,16 +58,18 @@ class JobManager(DBSessionMixin):
 
         self.logger.info("Stopping job manager")
 
-        # Cancel all running tasks
-        for job_id, task in list(self._tasks.items()):
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-                except Exception as e:
-                    self.logger.error(f"Error cancelling task {job_id}: {e}")
+        # Cancel all running tasks together, giving up on any that ignore cancellation for too long
+        pending = {task: job_id for job_id, task in self._tasks.items() if not task.done()}
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            done, timed_out = await asyncio.wait(pending, timeout=self.STOP_TIMEOUT)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    self.logger.error(f"Error cancelling task {pending[task]}: {task.exception()}")
+            for task in timed_out:
+                self.logger.error(f"Task {pending[task]} did not stop within {self.STOP_TIMEOUT}s")
 
         # Mark any remaining running jobs as failed
         for job in list(self._running_jobs.values()):
@@ -531,3 +535,8 @@ class JobManager(DBSessionMixin):
         except Exception as e:
             self.logger.error(f"Error waiting for job {job_id}: {str(e)}")
             return None
+
+
+def get_job_manager() -> JobManager:
+    """Get the process-wide job manager, constructing it only on first use"""
+    return JobManager._instance or JobManager()
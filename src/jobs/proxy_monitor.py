@@ -11,11 +11,25 @@ import os
 from urllib.parse import urlparse
 from src.config.config import Config
 import json
+import time
+import asyncio
+from typing import Dict, List, Optional, Tuple, Union
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 class ProxyMonitorJob(Job, DBSessionMixin):
     """Job that monitors proxy contracts for implementation upgrades"""
 
+    # Explorer requests in flight at once, one per pooled connection; the explorer also caps requests per second
+    MAX_CONCURRENT_FETCHES = EVMExplorer.MAX_CONNECTIONS
+    COMMIT_BATCH_SIZE = 50  # Contract updates written per commit
+    EVENTS_CACHE_TTL = 3600  # Seconds to reuse upgrade events fetched by an earlier run
+
+    # Contract identifier -> (fetched at, latest recorded upgrade block, events), shared across runs
+    _events_cache: Dict[str, Tuple[float, Optional[int], List[dict]]] = {}
+
     def __init__(self):
         super().__init__("proxy_monitor")
         self.logger = Logger("ProxyMonitorJob")
@@ -24,68 +38,153 @@ class ProxyMonitorJob(Job, DBSessionMixin):
         self.config = Config()
 
     async def stop_handler(self) -> None:
-        """Handle job stop request - nothing to clean up"""
-        return
+        """Handle job stop request - close the explorer's HTTP session"""
+        await self.explorer.aclose()
+
+    async def _get_upgrade_events(self, contract: Asset) -> List[dict]:
+        """Get a contract's proxy upgrade events, reusing recent results while nothing new was recorded"""
+        history = (contract.extra_data or {}).get("implementation_history") or []
+        block_number = history[-1].get("block_number") if history else None
+
+        cached = self._events_cache.get(contract.identifier)
+        if cached is not None and cached[1] == block_number and time.monotonic() - cached[0] < self.EVENTS_CACHE_TTL:
+            self.logger.info(f"Using cached upgrade events for {contract.identifier}")
+            return cached[2]
+
+        # Replaces any entry for an older upgrade block
+        events = await self.explorer.get_proxy_upgrade_events(contract.identifier)
+        self._events_cache[contract.identifier] = (time.monotonic(), block_number, events)
+        return events
+
+    @classmethod
+    def _evict_expired_events(cls) -> None:
+        """Drop cached upgrade events older than EVENTS_CACHE_TTL"""
+        now = time.monotonic()
+        expired = [key for key, (fetched_at, _, _) in cls._events_cache.items() if now - fetched_at >= cls.EVENTS_CACHE_TTL]
+        for key in expired:
+            del cls._events_cache[key]
+
+    async def _fetch_all_upgrade_events(self, contracts: List[Asset]) -> List[Union[List[dict], BaseException]]:
+        """Fetch upgrade events for all contracts concurrently, returning exceptions in place of failed results"""
+        self._evict_expired_events()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        async def fetch(contract: Asset) -> List[dict]:
+            async with semaphore:
+                return await self._get_upgrade_events(contract)
+
+        return await asyncio.gather(*[fetch(contract) for contract in contracts], return_exceptions=True)
+
+    async def _mark_non_proxies(self, session, contracts: List[Asset]) -> None:
+        """Mark contracts as checked non-proxies with a single bulk UPDATE"""
+        query = (
+            update(Asset)
+            .where(Asset.id.in_([contract.id for contract in contracts]))
+            .values(checked_for_proxy=True, is_proxy=False)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+        # Reflect the update on the loaded contracts without marking them for another write
+        for contract in contracts:
+            set_committed_value(contract, "checked_for_proxy", True)
+            set_committed_value(contract, "is_proxy", False)
+        self.logger.info(f"Marked {len(contracts)} contracts as non-proxies")
 
     async def start(self) -> None:
         """Start the proxy monitoring job"""
         try:
             self.logger.info("Starting proxy contract monitoring")
 
-            with self.get_session() as session:
+            async with self.get_async_session() as session:
                 # Get contracts that haven't been checked or are known proxies
-                contracts = (
-                    session.query(Asset)
-                    .filter(
+                query = (
+                    select(Asset)
+                    .options(selectinload(Asset.implementation))
+                    .where(
                         Asset.asset_type == AssetType.DEPLOYED_CONTRACT,
                         (Asset.checked_for_proxy == False) | (Asset.is_proxy == True),  # noqa: E712
                     )
-                    .all()
                 )
+                contracts = (await session.execute(query)).scalars().all()
 
                 self.logger.info(f"Found {len(contracts)} deployed contracts to check")
 
+                # Assets already loaded, by identifier, so implementation lookups can skip the database
+                assets_by_url = {contract.identifier: contract for contract in contracts}
                 for contract in contracts:
+                    if contract.implementation is not None:
+                        assets_by_url.setdefault(contract.implementation.identifier, contract.implementation)
+
+                # The explorer calls dominate, so fetch them concurrently; the session is used serially below
+                all_events = await self._fetch_all_upgrade_events(contracts)
+
+                # Explorer domain for each contract host, or None when unsupported, resolved once per host
+                explorer_domains: Dict[str, Optional[str]] = {}
+
+                # Non-proxies only need their status flags set, which is done for all of them at the end
+                non_proxies: List[Asset] = []
+
+                # Contract updates are committed in batches, and upgrade events are sent once their batch is committed
+                pending_updates = 0
+                pending_upgrades = []
+
+                async def commit_pending() -> None:
+                    nonlocal pending_updates
+                    await session.commit()
+                    self.logger.info(f"Committed changes for {pending_updates} contracts")
+                    pending_updates = 0
+
+                    if pending_upgrades:
+                        upgrades = pending_upgrades[:]
+                        pending_upgrades.clear()
+                        await self.handler_registry.trigger_events(upgrades)
+
+                for contract, events in zip(contracts, all_events):
                     try:
                         self.logger.info(f"Checking contract {contract.identifier}")
 
                         # Check for proxy upgrade events
-                        events = await self.explorer.get_proxy_upgrade_events(contract.identifier)
+                        if isinstance(events, BaseException):
+                            raise events
                         self.logger.info(f"Got events for {contract.identifier}: {json.dumps(events)}")
 
-                        # Initialize extra_data if None
-                        if contract.extra_data is None:
-                            contract.extra_data = {}
+                        if not events:
+                            if not contract.checked_for_proxy or contract.is_proxy:
+                                non_proxies.append(contract)
+                            self.logger.info(f"Found no upgrade events for {contract.identifier}, treating as non-proxy")
+                            continue
 
-                        # Update proxy status
-                        contract.checked_for_proxy = True
-                        contract.is_proxy = bool(events)
-                        self.logger.info(f"Set is_proxy={contract.is_proxy} for {contract.identifier}")
+                        # Only write the proxy status when it changed
+                        if not contract.checked_for_proxy or not contract.is_proxy or contract.extra_data is None:
+                            # A savepoint keeps a failure from expiring the other loaded contracts
+                            async with session.begin_nested():
+                                # Initialize extra_data if None
+                                if contract.extra_data is None:
+                                    contract.extra_data = {}
 
-                        # Always add and commit the contract after updating proxy status
-                        session.add(contract)
-                        session.commit()
-                        self.logger.info(
-                            f"Committed changes for {contract.identifier}: checked_for_proxy={contract.checked_for_proxy}, is_proxy={contract.is_proxy}"
-                        )
+                                # Update proxy status
+                                contract.checked_for_proxy = True
+                                contract.is_proxy = True
+                                self.logger.info(f"Set is_proxy=True for {contract.identifier}")
 
-                        if not events:
-                            self.logger.info(f"Marked {contract.identifier} as non-proxy")
-                            continue
+                            pending_updates += 1
 
                         # Get latest implementation address
                         latest_event = events[-1]
                         impl_address = latest_event["implementation"]
                         self.logger.info(f"Latest implementation for {contract.identifier}: {impl_address}")
 
-                        # Get explorer type from contract URL
-                        is_supported, explorer_type = self.explorer.is_supported_explorer(contract.identifier)
-                        if not is_supported:
+                        # Get explorer domain from the contract URL's host
+                        host = urlparse(contract.identifier).netloc
+                        if host not in explorer_domains:
+                            is_supported, explorer_type = self.explorer.is_supported_explorer(contract.identifier)
+                            explorer_domains[host] = self.explorer.EXPLORERS[explorer_type]["domain"] if is_supported else None
+                        explorer_domain = explorer_domains[host]
+                        if explorer_domain is None:
                             self.logger.error(f"Unsupported explorer URL: {contract.identifier}")
                             continue
 
-                        # Get explorer domain from config
-                        explorer_domain = self.explorer.EXPLORERS[explorer_type]["domain"]
                         impl_url = f"https://{explorer_domain}/address/{impl_address}"
                         self.logger.info(f"Implementation URL: {impl_url}")
 
@@ -95,79 +194,97 @@ class ProxyMonitorJob(Job, DBSessionMixin):
                             self.logger.info(f"Implementation unchanged for {contract.identifier}")
                             continue
 
-                        # Look for existing implementation asset
-                        impl_asset = session.query(Asset).filter(Asset.identifier == impl_url).first()
-                        self.logger.info(f"Found existing implementation asset: {impl_asset is not None}")
-
-                        # If implementation doesn't exist as an asset yet, create it
-                        if not impl_asset:
-                            self.logger.info(f"Creating new implementation asset for {impl_url}")
-                            # Use same directory structure as immunefi indexer
-                            base_dir = os.path.join(self.config.data_dir, str(contract.project_id))
-                            parsed_url = urlparse(impl_url)
-                            target_dir = os.path.join(base_dir, parsed_url.netloc, parsed_url.path.strip("/"))
-
-                            # Download implementation code
-                            self.logger.info(f"Downloading implementation code to {target_dir}")
-                            await fetch_verified_sources(impl_url, target_dir)
-
-                            # Create new implementation asset
-                            impl_asset = Asset(
-                                identifier=impl_url,
-                                project_id=contract.project_id,
-                                asset_type=AssetType.DEPLOYED_CONTRACT,
-                                source_url=impl_url,
-                                local_path=target_dir,
-                                extra_data={"is_implementation": True, "added_by_proxy_monitor": True},
+                        async with session.begin_nested():
+                            # Look for existing implementation asset
+                            impl_asset = assets_by_url.get(impl_url)
+                            if impl_asset is None:
+                                impl_query = select(Asset).where(Asset.identifier == impl_url)
+                                impl_asset = (await session.execute(impl_query)).scalars().first()
+                            self.logger.info(f"Found existing implementation asset: {impl_asset is not None}")
+
+                            # If implementation doesn't exist as an asset yet, create it
+                            if not impl_asset:
+                                self.logger.info(f"Creating new implementation asset for {impl_url}")
+                                # Use same directory structure as immunefi indexer
+                                base_dir = os.path.join(self.config.data_dir, str(contract.project_id))
+                                target_dir = os.path.join(base_dir, explorer_domain, "address", impl_address)
+
+                                # Download implementation code
+                                self.logger.info(f"Downloading implementation code to {target_dir}")
+                                await fetch_verified_sources(impl_url, target_dir)
+
+                                # Create new implementation asset
+                                impl_asset = Asset(
+                                    identifier=impl_url,
+                                    project_id=contract.project_id,
+                                    asset_type=AssetType.DEPLOYED_CONTRACT,
+                                    source_url=impl_url,
+                                    local_path=target_dir,
+                                    extra_data={"is_implementation": True, "added_by_proxy_monitor": True},
+                                )
+                                session.add(impl_asset)
+                                self.logger.info(f"Created new implementation asset: {impl_url}")
+
+                            assets_by_url[impl_url] = impl_asset
+
+                            # Update proxy relationship
+                            old_impl = contract.implementation
+                            contract.implementation = impl_asset
+                            self.logger.info(
+                                f"Updated implementation for {contract.identifier}: {old_impl.identifier if old_impl else 'None'} -> {impl_asset.identifier}"
                             )
-                            session.add(impl_asset)
-                            self.logger.info(f"Created new implementation asset: {impl_url}")
-
-                        # Update proxy relationship
-                        old_impl = contract.implementation
-                        contract.implementation = impl_asset
-                        self.logger.info(
-                            f"Updated implementation for {contract.identifier}: {old_impl.identifier if old_impl else 'None'} -> {impl_asset.identifier}"
-                        )
-
-                        # Update implementation history in extra_data
-                        if "implementation_history" not in contract.extra_data:
-                            contract.extra_data["implementation_history"] = []
-                        contract.extra_data["implementation_history"].append(
-                            {
-                                "address": impl_address,
-                                "url": impl_url,
-                                "block_number": latest_event["blockNumber"],
-                                "timestamp": latest_event["timestamp"],
-                            }
-                        )
-                        self.logger.info(
-                            f"Updated implementation history for {contract.identifier}, now has {len(contract.extra_data['implementation_history'])} entries"
-                        )
-
-                        # Commit changes
-                        session.commit()
-                        self.logger.info(f"Committed implementation changes for {contract.identifier}")
+
+                            # Update implementation history in extra_data, replacing the list so the change is tracked
+                            history = contract.extra_data.get("implementation_history", [])
+                            contract.extra_data["implementation_history"] = history + [
+                                {
+                                    "address": impl_address,
+                                    "url": impl_url,
+                                    "block_number": latest_event["blockNumber"],
+                                    "timestamp": latest_event["timestamp"],
+                                }
+                            ]
+                            self.logger.info(
+                                f"Updated implementation history for {contract.identifier}, now has {len(contract.extra_data['implementation_history'])} entries"
+                            )
+
+                        pending_updates += 1
 
                         # Only trigger upgrade event if there was a previous implementation
                         if old_impl:
-                            await self.handler_registry.trigger_event(
-                                HandlerTrigger.CONTRACT_UPGRADED,
-                                {
-                                    "proxy": contract,
-                                    "old_implementation": old_impl,
-                                    "new_implementation": impl_asset,
-                                    "event": latest_event,
-                                },
+                            pending_upgrades.append(
+                                (
+                                    HandlerTrigger.CONTRACT_UPGRADED,
+                                    {
+                                        "proxy": contract,
+                                        "old_implementation": old_impl,
+                                        "new_implementation": impl_asset,
+                                        "event": latest_event,
+                                    },
+                                )
                             )
 
                     except Exception as e:
+                        # Any savepoint in progress has already been rolled back
                         self.logger.error(f"Error processing contract {contract.identifier}: {str(e)}")
-                        session.rollback()
                         continue
 
+                    finally:
+                        if pending_updates >= self.COMMIT_BATCH_SIZE:
+                            await commit_pending()
+
+                if non_proxies:
+                    await self._mark_non_proxies(session, non_proxies)
+                    pending_updates += len(non_proxies)
+
+                if pending_updates:
+                    await commit_pending()
+
             await self.complete(JobResult(success=True, message="Proxy monitoring completed successfully"))
 
         except Exception as e:
             self.logger.error(f"Error in proxy monitoring job: {str(e)}")
             await self.fail(str(e))
+
+        finally:
+            await self.explorer.aclose()
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.types import UserDefinedType
 from src.backend.database import Base
@@ -93,7 +94,7 @@ class Asset(Base):
     asset_type = Column(String)
     source_url = Column(String)
     local_path = Column(String)
-    extra_data = Column(JSON)
+    extra_data = Column(MutableDict.as_mutable(JSON))  # Tracks in-place key updates
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     embedding = Column(VECTOR(384), nullable=True)  # For MiniLM-L6-v2 embeddings
@@ -1,9 +1,16 @@
 """Command parsing utilities"""
 
+import re
 import shlex
+import sys
 from typing import Dict, List, Tuple, Union, Optional
 from src.actions.base import ActionSpec
 
+# Characters that need shlex's quote and escape handling
+_SHLEX_SPECIAL = frozenset("\"'\\")
+# The only characters shlex splits on; str.split would also split on Unicode whitespace
+_SHLEX_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
 
 class CommandParser:
     """Unified command parser for all interfaces"""
@@ -18,10 +25,14 @@ class CommandParser:
         Returns:
             Tuple of (command_name, raw_args_string)
         """
-        # Split only on the first whitespace to preserve quotes in args
         message = message.lstrip("/")
+        if not message or message.isspace():
+            return "", ""
+
+        # Split only on the first whitespace to preserve quotes in args
         parts = message.split(None, 1)
-        command = parts[0] if parts else ""
+        # Intern the name so action lookups compare it by identity
+        command = sys.intern(parts[0])
         args_str = parts[1] if len(parts) > 1 else ""
         return command, args_str
 
@@ -40,68 +51,18 @@ class CommandParser:
             return []
 
         try:
-            # Use shlex with posix=True to handle quotes properly
-            parts = shlex.split(args_str, posix=True)
-
-            # Check if any unquoted part contains =
-            # We can detect this by comparing the original string with the split parts
-            is_key_value = False
-            start_idx = 0
-            for part in parts:
-                # Find this part in the original string
-                while start_idx < len(args_str):
-                    # Skip whitespace
-                    while start_idx < len(args_str) and args_str[start_idx].isspace():
-                        start_idx += 1
-
-                    # If we find a quote, this part was quoted
-                    if start_idx < len(args_str) and args_str[start_idx] in "\"'":
-                        break
-
-                    # If we find an equals sign before the part, it's a key-value pair
-                    if start_idx < len(args_str) and args_str[start_idx] == "=":
-                        is_key_value = True
-                        break
-
-                    # If we find the part and it contains an equals sign, it's a key-value pair
-                    if start_idx < len(args_str) and args_str.startswith(part, start_idx) and "=" in part:
-                        is_key_value = True
-                        break
-
-                    start_idx += 1
-
-                if is_key_value:
-                    break
+            if _SHLEX_SPECIAL.isdisjoint(args_str):
+                # Fast path: without quotes or escapes shlex only splits on its whitespace,
+                # and any equals sign is unquoted
+                parts = [part for part in _SHLEX_WHITESPACE.split(args_str) if part]
+                is_key_value = "=" in args_str
+            else:
+                # Use shlex with posix=True to handle quotes properly
+                parts = shlex.split(args_str, posix=True)
+                is_key_value = CommandParser._has_unquoted_equals(args_str, parts)
 
             if is_key_value:
-                kwargs = {}
-                current_key = None
-                current_value = []
-
-                for part in parts:
-                    # Only split on = if the part isn't quoted (doesn't start/end with quotes)
-                    is_quoted = (part.startswith('"') and part.endswith('"')) or (part.startswith("'") and part.endswith("'"))
-                    if "=" in part and not is_quoted:
-                        # If we have a previous key, store it
-                        if current_key:
-                            kwargs[current_key] = " ".join(current_value)
-
-                        # Start new key=value pair
-                        key, value = part.split("=", 1)
-                        current_key = key.strip()
-                        current_value = [value.strip()] if value else []
-                    elif current_key:
-                        # Append to current value
-                        current_value.append(part)
-                    else:
-                        # Handle case where first part doesn't contain =
-                        continue
-
-                # Store the last key=value pair
-                if current_key:
-                    kwargs[current_key] = " ".join(current_value)
-
-                return kwargs
+                return CommandParser._parse_key_values(parts)
 
             # Return as positional arguments
             return parts
@@ -109,6 +70,65 @@ class CommandParser:
         except ValueError as e:
             raise ValueError(f"Failed to parse arguments: {str(e)}")
 
+    @staticmethod
+    def _has_unquoted_equals(args_str: str, parts: List[str]) -> bool:
+        """Check if any unquoted part of the original string contains =
+
+        Only the text before the first quote counts: it contains an equals sign, or the
+        first part (containing one) starts there and runs on into the quoted text.
+        """
+        if not parts:
+            return False
+
+        quote_positions = [pos for pos in (args_str.find('"'), args_str.find("'")) if pos >= 0]
+        first_quote = min(quote_positions) if quote_positions else len(args_str)
+        if "=" in args_str[:first_quote]:
+            return True
+
+        first = parts[0]
+        if "=" in first:
+            idx = args_str.find(first)
+            while 0 <= idx < first_quote:
+                if not args_str[idx].isspace():
+                    return True
+                idx = args_str.find(first, idx + 1)
+
+        return False
+
+    @staticmethod
+    def _parse_key_values(parts: List[str]) -> Dict[str, str]:
+        """Group split parts into key=value pairs, joining values that span several parts"""
+        kwargs = {}
+        current_key = None
+        current_value = []  # Reused for every key
+
+        for part in parts:
+            # Only split on = if the part isn't quoted (doesn't start/end with quotes)
+            is_quoted = (part.startswith('"') and part.endswith('"')) or (part.startswith("'") and part.endswith("'"))
+            if "=" in part and not is_quoted:
+                # If we have a previous key, store it
+                if current_key:
+                    kwargs[current_key] = " ".join(current_value)
+
+                # Start new key=value pair
+                key, value = part.split("=", 1)
+                current_key = key.strip()
+                current_value.clear()
+                if value:
+                    current_value.append(value.strip())
+            elif current_key:
+                # Append to current value
+                current_value.append(part)
+            else:
+                # Handle case where first part doesn't contain =
+                continue
+
+        # Store the last key=value pair
+        if current_key:
+            kwargs[current_key] = " ".join(current_value)
+
+        return kwargs
+
     @staticmethod
     def validate_arguments(args: Union[List[str], Dict[str, str]], spec: Optional[ActionSpec] = None) -> bool:
         """Validate arguments against command spec.
@@ -1,8 +1,9 @@
 from sentence_transformers import SentenceTransformer
 from src.models.base import Asset
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import numpy as np
 import logging
+import asyncio
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from src.config.config import Config
@@ -36,6 +37,11 @@ class EmbeddingGenerator:
         embedding = self._model.encode(text, convert_to_tensor=False)
         return embedding.tolist()
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts in a single model call"""
+        embeddings = self._model.encode(texts, convert_to_tensor=False)
+        return [embedding.tolist() for embedding in embeddings]
+
 
 async def generate_embedding(text: str) -> List[float]:
     """Generate embedding for text"""
@@ -43,6 +49,15 @@ async def generate_embedding(text: str) -> List[float]:
     return generator.generate_embedding(text)
 
 
+async def generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for a batch of texts"""
+    if not texts:
+        return []
+    generator = EmbeddingGenerator.get_instance()
+    # Encode in a worker thread so the event loop keeps serving database writes meanwhile
+    return await asyncio.to_thread(generator.generate_embeddings, texts)
+
+
 async def generate_file_embeddings(files: List[Dict[str, str]]) -> List[float]:
     """Generate and combine embeddings for multiple files
 
@@ -73,22 +88,22 @@ async def generate_file_embeddings(files: List[Dict[str, str]]) -> List[float]:
     return combined.tolist()
 
 
-def update_embedding_raw(session: Session, asset_id: str, embedding: List[float]) -> None:
-    """Update embedding directly using raw SQL to ensure correct type conversion"""
-    logging.info(f"Updating embedding for asset {asset_id}")
-
-    # Convert numpy arrays to lists if needed
+def vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector literal, to be bound as a parameter and cast to vector"""
     if isinstance(embedding, np.ndarray):
         embedding = embedding.tolist()
+    return f"[{','.join(map(str, embedding))}]"
 
-    # Convert to string format that pgvector expects
-    embedding_str = f"[{','.join(str(x) for x in embedding)}]"
 
-    # Update using direct assignment
+def update_embedding_raw(session: Session, asset_id: str, embedding: List[float]) -> None:
+    """Update embedding directly using raw SQL to ensure correct type conversion"""
+    logging.info(f"Updating embedding for asset {asset_id}")
+
+    # Update using direct assignment (CAST, since ":embedding::vector" isn't parsed as a bind parameter)
     try:
         result = session.execute(
-            text("UPDATE assets SET embedding = :embedding::vector WHERE id = :id"),
-            {"id": asset_id, "embedding": embedding_str},
+            text("UPDATE assets SET embedding = CAST(:embedding AS vector) WHERE id = :id"),
+            {"id": asset_id, "embedding": vector_literal(embedding)},
         )
         logging.info(f"Update result: {result.rowcount} rows affected")
     except Exception as e:
@@ -114,3 +129,28 @@ async def update_asset_embedding(asset: Asset) -> List[float]:
     except Exception as e:
         logger.error(f"Failed to generate embedding for asset {asset.id}: {str(e)}")
         raise
+
+
+async def batch_update_asset_embeddings(assets: List[Asset]) -> List[Tuple[int, List[float]]]:
+    """Generate embeddings for a batch of assets in one model call
+
+    Returns:
+        (asset id, embedding) pairs; assets without embeddable text are skipped
+    """
+    logger = logging.getLogger()
+    logger.info(f"Generating embeddings for {len(assets)} assets")
+
+    ids, texts = [], []
+    for asset in assets:
+        try:
+            text = asset.generate_embedding_text()
+            if not text:
+                raise ValueError("No text content available for embedding")
+        except Exception as e:
+            logger.error(f"Failed to generate embedding for asset {asset.id}: {str(e)}")
+            continue
+        ids.append(asset.id)
+        texts.append(text)
+
+    embeddings = await generate_embeddings(texts)
+    return list(zip(ids, embeddings))
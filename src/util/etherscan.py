@@ -1,7 +1,10 @@
 import os
 import aiohttp
+import asyncio
 import json
+import time
 import aiofiles
+from collections import deque
 from src.config.config import Config
 from typing import Optional, Tuple, List, Dict
 from urllib.parse import urlparse
@@ -21,6 +24,13 @@ class ExplorerType(Enum):
 class EVMExplorer:
     """Handles interaction with various EVM blockchain explorers"""
 
+    MAX_CONNECTIONS = 10  # Pooled connections shared by all requests
+    DNS_CACHE_TTL = 300  # Seconds to cache resolved explorer hosts
+    REQUESTS_PER_SECOND = 5  # API calls started per second, the free tier limit
+
+    # Explorer message for a query that matched nothing, as opposed to a failed request
+    NO_RECORDS_MESSAGE = "No records found"
+
     # Explorer configurations
     EXPLORERS = {
         ExplorerType.ETHERSCAN: {
@@ -43,6 +53,40 @@ class EVMExplorer:
 
         self.config = Config()
         self.logger = logging.getLogger("EVMExplorer")  # pylint: disable=no-member
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_lock = asyncio.Lock()
+        self._request_times: deque = deque()  # Start times of the requests made in the last second
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use so connections are kept alive between requests"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS, ttl_dns_cache=self.DNS_CACHE_TTL)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _throttle(self) -> None:
+        """Wait until another request fits within REQUESTS_PER_SECOND"""
+        async with self._rate_lock:
+            while True:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= 1:
+                    self._request_times.popleft()
+                if len(self._request_times) < self.REQUESTS_PER_SECOND:
+                    break
+                await asyncio.sleep(1 - (now - self._request_times[0]))
+            self._request_times.append(now)
+
+    async def _get_json(self, url: str) -> Dict:
+        """Fetch an API URL through the shared session, within the request rate limit"""
+        await self._throttle()
+        async with self._get_session().get(url) as response:
+            return await response.json()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def is_supported_explorer(self, url: str) -> Tuple[bool, Optional[ExplorerType]]:
         """Check if a URL is from a supported explorer
@@ -124,13 +168,14 @@ class EVMExplorer:
             )
 
             # Fetch logs
-            async with aiohttp.ClientSession() as session:
-                async with session.get(full_api_url) as response:
-                    data = await response.json()
+            data = await self._get_json(full_api_url)
 
             if data["status"] != "1":
-                self.logger.warning(f"No upgrade events found for {address}: {data.get('message', 'Unknown error')}")
-                return []
+                if data.get("message") == self.NO_RECORDS_MESSAGE:
+                    self.logger.info(f"No upgrade events found for {address}")
+                    return []
+                # Rate limits and other errors must not pass for a contract without upgrades
+                raise RuntimeError(f"Explorer API error for {address}: {data.get('message')} - {data.get('result')}")
 
             # Process events
             events = []
@@ -155,7 +200,7 @@ class EVMExplorer:
 
         except Exception as e:
             self.logger.error(f"Error getting proxy upgrade events: {str(e)}")
-            return []
+            raise
 
     async def _get_block_timestamp(self, explorer_type: ExplorerType, block_number: int, api_key: str) -> str:
         """Get timestamp for a block number"""
@@ -163,9 +208,7 @@ class EVMExplorer:
             api_url = self.get_api_url(explorer_type)
             full_api_url = f"{api_url}?module=block&action=getblockreward" f"&blockno={block_number}" f"&apikey={api_key}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(full_api_url) as response:
-                    data = await response.json()
+            data = await self._get_json(full_api_url)
 
             if data["status"] == "1" and "result" in data:
                 return data["result"]["timeStamp"]
@@ -0,0 +1,214 @@
+"""File search helpers run by worker processes, kept free of database imports so workers start cheaply"""
+
+import mmap
+import os
+import re
+import warnings
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from src.util.logging import Logger
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional
+    re2 = None
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Memory budget for a single compiled RE2 program
+RE2_MAX_MEM = 64 << 20
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+READ_BUFFER_SIZE = 1 << 20
+
+# Characters of context reported on each side of a match
+CONTEXT_CHARS = 50
+# A UTF-8 character takes at most this many bytes
+MAX_CHAR_BYTES = 4
+# UTF-8 continuation bytes, which never start a character
+_UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+logger = Logger("FileSearchJob")
+
+
+@lru_cache(maxsize=128)
+def compile_pattern(regex_pattern: str):
+    """Compile a search pattern, reusing the compiled object for repeated searches
+
+    Patterns are compiled in bytes mode so file contents can be matched without decoding.
+    Uses google-re2 when installed, which matches in linear time. Patterns relying on
+    features RE2 does not support (backreferences, lookaround) fall back to Python's re.
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.max_mem = RE2_MAX_MEM
+        options.case_sensitive = False
+        # Unsupported patterns fall back to re below, so don't let RE2 log them
+        options.log_errors = False
+        try:
+            return re2.compile(b"(?m)" + regex_pattern.encode(), options)
+        except re2.error:
+            pass
+    return re.compile(regex_pattern.encode(), re.IGNORECASE | re.MULTILINE)
+
+
+@lru_cache(maxsize=128)
+def required_literal(regex_pattern: str) -> Optional[bytes]:
+    """Extract the longest literal that every match of the pattern must contain
+
+    Only top-level literal runs (including those inside plain groups) are considered,
+    so the result is conservative: a file without this literal cannot match. Returned
+    lowercased, since searches are case-insensitive. Returns None if no usable literal
+    exists.
+
+    The pattern is parsed with Python's re parser, while RE2 may run the actual match.
+    Patterns the two could read differently (POSIX classes such as [[:space:]], which
+    re warns about as nested sets) get no literal, so the filter never drops a file
+    that could match.
+    """
+    if "[:" in regex_pattern:
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            parsed = sre_parse.parse(regex_pattern, re.IGNORECASE)
+    except Exception:
+        return None
+
+    longest = max(_literal_runs(parsed), key=len)
+    return longest.lower() if len(longest) >= 2 else None
+
+
+@lru_cache(maxsize=128)
+def _literal_searcher(literal: bytes):
+    """Compile a case-insensitive search for a literal, which scans bytes or an mmap without copying it"""
+    return re.compile(re.escape(literal), re.IGNORECASE)
+
+
+def _literal_runs(items) -> List[bytes]:
+    """Collect consecutive ASCII literal runs from a parsed pattern sequence"""
+    runs, current = [], bytearray()
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            current.append(av)
+            continue
+
+        runs.append(bytes(current))
+        current = bytearray()
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub_items = av
+            # Groups that change flags could alter case sensitivity
+            if not add_flags and not del_flags:
+                runs.extend(_literal_runs(sub_items))
+
+    runs.append(bytes(current))
+    return runs
+
+
+def is_binary_file(file_path: str) -> bool:
+    """Check if a file is binary by reading its first few bytes"""
+    try:
+        with open(file_path, "rb") as f:
+            chunk = f.read(1024)
+            if not chunk:  # Empty file
+                return False
+            # Check for null bytes and high concentration of non-text bytes
+            textchars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+            return bool(chunk.translate(None, textchars))
+    except Exception:
+        return True
+
+
+def search_file(file_path: str, pattern, literal: Optional[bytes] = None) -> List[Dict]:
+    """Search a single file for regex matches
+
+    Args:
+        file_path: Path of the file to search
+        pattern: Compiled bytes pattern
+        literal: Optional lowercased literal that all matches contain, used to skip
+            files cheaply before running the regex
+    """
+    with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return _find_matches(content, pattern, literal)
+        return _find_matches(f.read(), pattern, literal)
+
+
+def _char_count(data: bytes) -> int:
+    """Count the UTF-8 characters in data by skipping continuation bytes"""
+    return len(data.translate(None, _UTF8_CONTINUATION))
+
+
+def _find_matches(content, pattern, literal: Optional[bytes] = None) -> List[Dict]:
+    """Find matches of a bytes pattern in file content (bytes or mmap)
+
+    Match positions are reported as character offsets and context as characters,
+    as if the file had been decoded as UTF-8.
+    """
+    if literal:
+        # Literals without letters need no case folding
+        if literal.lower() != literal.upper():
+            found = _literal_searcher(literal).search(content) is not None
+        else:
+            found = content.find(literal) >= 0
+        if not found:
+            return []
+
+    file_matches = []
+    line, chars, last_offset = 1, 0, 0
+    window = CONTEXT_CHARS * MAX_CHAR_BYTES
+
+    # Use finditer to get non-overlapping matches with positions
+    for match in pattern.finditer(content):
+        match_bytes = match.group(0)
+        match_text = match_bytes.decode("utf-8", errors="replace")
+        logger.debug(f"Match: {match_text}")
+
+        # Count newlines and characters incrementally since matches arrive in order
+        skipped = content[last_offset : match.start()]
+        line += skipped.count(b"\n")
+        chars += _char_count(skipped)
+        last_offset = match.start()
+        start, end = chars, chars + _char_count(match_bytes)
+
+        # Get some context around the match, wide enough in bytes to hold whole characters
+        before = content[max(0, match.start() - window) : match.start()].decode("utf-8", errors="replace")
+        after = content[match.end() : match.end() + window].decode("utf-8", errors="replace")
+        context = before[-CONTEXT_CHARS:] + match_text + after[:CONTEXT_CHARS]
+
+        # Get the match info - we want to match any occurrence of the pattern
+        match_info = {"match": match_text, "context": context, "line": line, "start": start, "end": end}
+        file_matches.append(match_info)
+
+    return file_matches
+
+
+def search_shard(regex_pattern: str, file_paths: List[str], pattern=None) -> List[Tuple[str, List[Dict]]]:
+    """Search a shard of files, returning (file_path, matches) for files that matched
+
+    Runs inside worker processes, so unless a compiled pattern is given the pattern
+    is compiled once per worker.
+    """
+    if pattern is None:
+        pattern = compile_pattern(regex_pattern)
+    literal = required_literal(regex_pattern)
+
+    results = []
+    for file_path in file_paths:
+        try:
+            if is_binary_file(file_path):
+                continue
+            file_matches = search_file(file_path, pattern, literal)
+            if file_matches:
+                results.append((file_path, file_matches))
+        except Exception as e:
+            logger.error(f"Error searching file {file_path}: {str(e)}")
+    return results
@@ -9,6 +9,15 @@ from src.backend.database import DBSessionMixin
 logger = Logger("TestDBQuery")
 
 
+class MockRow(tuple):
+    """Result row supporting positional and mapping access like a SQLAlchemy Row"""
+
+    def __new__(cls, mapping):
+        row = super().__new__(cls, mapping.values())
+        row._mapping = mapping
+        return row
+
+
 @pytest.fixture
 def mock_session():
     with patch("src.backend.database.DBSessionMixin.get_session") as mock:
@@ -17,9 +26,8 @@ def mock_session():
         session.__exit__ = Mock(return_value=None)
 
         # Mock query results with proper _mapping attribute
-        result_row = Mock()
         mapping_dict = {"id": "test-id", "asset_type": "github_file", "source_url": "https://github.com/test/repo"}
-        result_row._mapping = mapping_dict
+        result_row = MockRow(mapping_dict)
 
         session.execute.return_value.all.return_value = [result_row]
 
@@ -32,8 +40,7 @@ def mock_query_builder():
     with patch("src.actions.db_query.QueryBuilder") as mock:
         builder = Mock()
         # Mock the builder to return itself for method chaining
-        builder.from_spec = Mock(return_value=builder)
-        builder.build = Mock(return_value="SELECT * FROM assets")
+        builder.build_spec = Mock(return_value="SELECT * FROM assets")
         mock.return_value = builder
         yield builder
 
@@ -72,12 +79,12 @@ async def test_db_query_action(mock_session, mock_query_builder):
         assert "Invalid query format" in str(result)
 
         # Test invalid query spec
-        mock_query_builder.from_spec.side_effect = ValueError("Invalid query")
+        mock_query_builder.build_spec.side_effect = ValueError("Invalid query")
         result = await action.execute('{"invalid": "spec"}')
         assert "Error executing query" in str(result)
 
         # Reset mock for remaining tests
-        mock_query_builder.from_spec.side_effect = None
+        mock_query_builder.build_spec.side_effect = None
 
         # Test query with no results
         mock_session.execute.return_value.all.return_value = []
@@ -85,9 +92,8 @@ async def test_db_query_action(mock_session, mock_query_builder):
         assert "No results found." in str(result)
 
         # Test query with special characters
-        result_row = Mock()
         mapping_dict = {"id": "test,id", "description": 'test"description', "list_field": ["item1", "item2"]}
-        result_row._mapping = mapping_dict
+        result_row = MockRow(mapping_dict)
         mock_session.execute.return_value.all.return_value = [result_row]
 
         result = await action.execute(json.dumps(query_spec))
@@ -0,0 +1,40 @@
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from src.actions.semantic_search import SemanticSearchAction
+from src.actions.result import ResultType
+
+
+@pytest.fixture
+def semantic_search_action():
+    with patch("src.actions.semantic_search.Config") as config_mock:
+        config_mock.return_value.embeddings_dimension = 2
+        action = SemanticSearchAction()
+
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.execute.return_value = []
+    action.get_session = MagicMock(return_value=session)
+    return action, session
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_binds_embedding(semantic_search_action):
+    """Test that the query embedding is bound as a parameter into a constant statement"""
+    action, session = semantic_search_action
+    embeddings = AsyncMock(side_effect=[[0.5, -1.0], [0.25, 2.0]])
+
+    with patch("src.actions.semantic_search.generate_embedding", embeddings):
+        result = await action.execute("token swaps")
+        await action.execute("access control")
+
+    assert result.type == ResultType.TEXT
+    assert result.content == "No matching results found."
+
+    (first_sql, first_params), (second_sql, second_params) = [call.args for call in session.execute.call_args_list]
+    sql = str(first_sql)
+    assert sql == str(second_sql)  # Same statement text for every query
+    assert sql.count("CAST(:embedding AS vector(2))") == 2
+    assert "0.5" not in sql  # Values are bound, not formatted into the SQL
+    assert set(first_sql.compile().params) == {"embedding"}
+    assert first_params == {"embedding": "[0.5,-1.0]"}
+    assert second_params == {"embedding": "[0.25,2.0]"}
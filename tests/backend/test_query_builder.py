@@ -1,5 +1,5 @@
 import pytest
-from src.backend.query_builder import QueryBuilder
+from src.backend.query_builder import QueryBuilder, _COLUMN_CACHE, _col, row_decoder
 from src.models.base import Asset, Project
 from sqlalchemy.sql.selectable import Select
 
@@ -89,3 +89,67 @@ def test_query_spec():
 
     with pytest.raises(ValueError, match="must include 'table' and 'on' fields"):
         QueryBuilder.from_spec({"from": "assets", "join": {"table": "projects"}})  # Missing 'on'
+
+
+def test_build_spec_cache():
+    spec = {"from": "assets", "where": [{"field": "asset_type", "op": "=", "value": "github_file"}], "limit": 5}
+
+    # Identical specs share the built statement regardless of key order
+    query = QueryBuilder.build_spec(spec)
+    assert isinstance(query, Select)
+    assert QueryBuilder.build_spec(dict(reversed(list(spec.items())))) is query
+
+    # Different values produce a different statement
+    other = {**spec, "where": [{"field": "asset_type", "op": "=", "value": "github_repo"}]}
+    assert QueryBuilder.build_spec(other) is not query
+
+    # Invalid specs still raise every time
+    for _ in range(2):
+        with pytest.raises(ValueError, match="must include 'from'"):
+            QueryBuilder.build_spec({"select": ["id"]})
+
+
+def test_where_operators():
+    qb = QueryBuilder().from_table("assets")
+    qb.where("asset_type", "eq", "github_file").where("assets.id", "in", 1).where("source_url", "is not null", None)
+    assert len(qb._conditions) == 3
+
+    with pytest.raises(ValueError, match="Invalid operator"):
+        qb.where("asset_type", "between", [1, 2])
+
+    with pytest.raises(ValueError, match="Field invalid_field does not exist"):
+        qb.where("invalid_field", "=", 1)
+
+
+def test_invalid_field_format():
+    qb = QueryBuilder().from_table("assets")
+
+    for field in ["assets.id.extra", "assets.", ".id"]:
+        with pytest.raises(ValueError, match="Invalid field format"):
+            qb.select(field)
+        with pytest.raises(ValueError, match="Invalid field format"):
+            qb.where(field, "=", 1)
+        with pytest.raises(ValueError, match="Invalid field format"):
+            qb.order_by(field)
+
+
+def test_column_cache():
+    assert _col(Asset, "source_url") is Asset.source_url
+    assert _COLUMN_CACHE[(Asset, "source_url")] is Asset.source_url
+
+    # Failed lookups raise every time and are never cached
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Field sourceurl does not exist in Asset"):
+            _col(Asset, "sourceurl")
+    assert (Asset, "sourceurl") not in _COLUMN_CACHE
+
+
+def test_row_decoder():
+    decode = row_decoder(("id", "source_url", "it's"))
+    assert decode is row_decoder(("id", "source_url", "it's"))
+    assert decode((1, "https://github.com/test/repo", None)) == {
+        "id": 1,
+        "source_url": "https://github.com/test/repo",
+        "it's": None,
+    }
+    assert row_decoder(())(()) == {}
@@ -0,0 +1,59 @@
+import pytest
+from src.config.config import Config, _merge_configs
+from src.config.schema import CONFIG_SCHEMA, REQUIRED_TOP
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """Config with a private base config so merges don't leak into other tests"""
+    config = Config()
+    monkeypatch.setattr(Config, "_config", {"data_dir": "./test_data", "llm": {"openai": {"model": "gpt-4"}}})
+    Config._get_cache.clear()
+    yield config
+    Config._get_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_load_extension_configs(config, tmp_path):
+    """Test that extension configs are merged in path order regardless of read order"""
+    first = tmp_path / "first.yml"
+    first.write_text("my_ext:\n  enabled: true\n  level: 1\n")
+    second = tmp_path / "second.yml"
+    second.write_text("my_ext:\n  level: 2\nllm:\n  personality: terse\n")
+
+    assert config.get("llm.personality") is None
+    await config.load_extension_configs([str(first), str(tmp_path / "missing.yml"), str(second)])
+
+    assert config.get("my_ext") == {"enabled": True, "level": 2}
+    assert config.get("llm.personality") == "terse"
+    assert config.get("llm.openai.model") == "gpt-4"
+
+
+def test_config_schema_is_frozen():
+    """Test that the schema can't be mutated and required keys are precomputed"""
+    assert REQUIRED_TOP == {"database", "data_dir"}
+
+    with pytest.raises(TypeError):
+        CONFIG_SCHEMA["properties"]["data_dir"]["type"] = "integer"
+    with pytest.raises(AttributeError):
+        CONFIG_SCHEMA["required"].append("llm")
+
+
+def test_merge_configs_deep():
+    """Test that nested sections are merged rather than replaced"""
+    base = {"llm": {"openai": {"key": "k", "model": "gpt-4"}}, "data_dir": "./data"}
+    _merge_configs(base, {"llm": {"openai": {"model": "gpt-4o"}, "personality": "terse"}, "data_dir": None})
+    assert base == {"llm": {"openai": {"key": "k", "model": "gpt-4o"}, "personality": "terse"}, "data_dir": None}
+
+    # Deep trees don't hit the recursion limit
+    trees = []
+    for leaf in ("old", "new"):
+        tree = current = {}
+        for _ in range(5000):
+            current["child"] = {}
+            current = current["child"]
+        current["value"] = leaf
+        trees.append((tree, current))
+    (base, base_leaf), (update, _) = trees
+    _merge_configs(base, update)
+    assert base_leaf["value"] == "new"
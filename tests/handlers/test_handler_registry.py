@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock
 from src.handlers.base import Handler, HandlerTrigger
@@ -69,3 +70,57 @@ async def test_trigger_event_with_error(handler_registry):
     # Should not raise exception
     event_bus = EventBus()
     await event_bus.trigger_event(HandlerTrigger.NEW_PROJECT, context)
+
+
+@pytest.mark.asyncio
+async def test_reusable_handler_isolates_context(handler_registry):
+    """Test that a shared handler instance sees each event's own context"""
+    instances = []
+    seen = []
+
+    class ReusableHandler(MockHandler):
+        REUSABLE = True
+
+        def __init__(self):
+            super().__init__()
+            instances.append(self)
+
+        async def handle(self) -> None:
+            project = self.context["project"]
+            await asyncio.sleep(0.01)  # Let the other event run concurrently
+            seen.append((project, self.context["project"]))
+
+    handler_registry.register_handler(ReusableHandler)
+    event_bus = EventBus()
+    await asyncio.gather(
+        event_bus.trigger_event(HandlerTrigger.NEW_PROJECT, {"project": "a"}),
+        event_bus.trigger_event(HandlerTrigger.NEW_PROJECT, {"project": "b"}),
+    )
+
+    assert len(instances) == 1
+    assert sorted(seen) == [("a", "a"), ("b", "b")]
+
+
+@pytest.mark.asyncio
+async def test_trigger_events_batch(handler_registry):
+    """Test that a batch of events runs every handler with bounded concurrency"""
+    seen = []
+    running = 0
+    peak = 0
+
+    class BatchHandler(MockHandler):
+        async def handle(self) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            seen.append(self.context["project"])
+            running -= 1
+
+    handler_registry.register_handler(BatchHandler)
+    event_bus = EventBus()
+    event_bus._fanout = asyncio.Semaphore(2)
+    await event_bus.trigger_events([(HandlerTrigger.NEW_PROJECT, {"project": i}) for i in range(5)])
+
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+    assert peak == 2
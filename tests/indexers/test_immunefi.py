@@ -317,3 +317,31 @@ async def test_asset_path_traversal_prevention(mock_session, mock_handler_regist
         "..\\..\\Windows\\System32\\config\\SAM" in msg or "../../Windows/System32/config/SAM" in msg for msg in warning_calls
     ), "Windows path traversal not caught"
     assert any("/etc/shadow" in msg for msg in warning_calls), "Absolute path not caught"
+
+
+@pytest.mark.asyncio
+async def test_index_project_batch(mock_session, mock_handler_registry):
+    """Test that a batch sync only processes the requested projects and skips removal cleanup"""
+    bounty_data = [
+        {"project": "Alpha", "assets": [{"url": "https://github.com/alpha/repo", "revision": 1}]},
+        {"project": "Beta", "assets": []},
+        {"project": "Gamma", "assets": []},
+    ]
+    response = MagicMock()
+    response.raise_for_status = Mock()
+    response.json = AsyncMock(return_value=bounty_data)
+    http_session = MagicMock()
+    http_session.__aenter__.return_value = http_session
+    http_session.get.return_value.__aenter__.return_value = response
+
+    indexer = ImmunefiIndexer(session=mock_session)
+    indexer.handler_registry = mock_handler_registry
+    indexer.process_bounty = AsyncMock()
+    indexer.cleanup_removed_projects = AsyncMock()
+
+    with patch("src.indexers.immunefi.aiohttp.ClientSession", return_value=http_session):
+        await indexer.index(projects=["Gamma", "Alpha", "Missing"])
+
+    processed = [call.args[0]["project"] for call in indexer.process_bounty.await_args_list]
+    assert processed == ["Alpha", "Gamma"]
+    indexer.cleanup_removed_projects.assert_not_awaited()
@@ -0,0 +1,23 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.jobs.autobot import AutobotJob
+
+
+@pytest.mark.asyncio
+async def test_autobot_execution_time():
+    """Test that execution time is measured on the monotonic clock"""
+    with patch("src.jobs.autobot.Chatbot") as chatbot_cls:
+        chatbot = chatbot_cls.return_value
+        chatbot.process_message = AsyncMock(return_value="done")
+        chatbot.history = [{"role": "system"}, {"role": "user"}]
+
+        job = AutobotJob("check the contracts")
+        job.complete = AsyncMock()
+
+        with patch("src.jobs.autobot.time.monotonic", side_effect=[100.0, 102.5]):
+            await job.run()
+
+    result = job.complete.call_args[0][0]
+    assert result.success
+    assert result.data["execution_time"] == 2.5
+    assert result.data["final_result"] == "done"
@@ -0,0 +1,165 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from src.jobs.embed import EmbedJob, _batch_update_query
+
+
+def test_batch_update_query():
+    """Test that a batch of embeddings becomes one parameterized UPDATE"""
+    query, params = _batch_update_query([(1, [0.5, -1.0]), (7, [0.25, 2.0])], 2)
+
+    sql = str(query)
+    assert "vector(2)" in sql
+    assert "(CAST(:id0 AS integer), CAST(:emb0 AS text)), (CAST(:id1 AS integer), CAST(:emb1 AS text))" in sql
+    assert "0.5" not in sql  # Values are bound, not formatted into the SQL
+    assert params == {"id0": 1, "emb0": "[0.5,-1.0]", "id1": 7, "emb1": "[0.25,2.0]"}
+
+
+def stream_result(assets, batch_size):
+    """Mock a streamed query result partitioned by yield_per"""
+
+    async def partitions():
+        for start in range(0, len(assets), batch_size):
+            yield assets[start : start + batch_size]
+
+    result = Mock()
+    result.scalars.return_value.partitions = Mock(side_effect=partitions)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_embed_job_batches():
+    """Test that assets are embedded and committed one batch at a time"""
+    assets = [Mock(id=i) for i in range(5)]
+
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.stream = AsyncMock(return_value=stream_result(assets, 2))
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+
+    async def fake_embeddings(batch):
+        # Asset 3 has no text and is skipped
+        return [(asset.id, [float(asset.id)] * 12 + [0.5]) for asset in batch if asset.id != 3]
+
+    job = EmbedJob()
+    job.BATCH_SIZE = 2
+    job.get_async_session = Mock(return_value=session)
+    job.complete = AsyncMock()
+
+    with patch("src.jobs.embed.batch_update_asset_embeddings", side_effect=fake_embeddings) as embed:
+        await job.start()
+
+    assert [[a.id for a in call.args[0]] for call in embed.await_args_list] == [[0, 1], [2, 3], [4]]
+    query = session.stream.await_args.args[0]
+    assert query.get_execution_options()["yield_per"] == 2
+    assert "JOIN" not in str(query)  # Projects are loaded per batch, not joined
+    assert session.execute.await_count == 3  # One UPDATE per batch
+    assert session.commit.await_count == 3
+    assert (job.processed, job.failed) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_embed_job_overlaps_writes():
+    """Test that the next batch is embedded while the previous one is being committed"""
+    assets = [Mock(id=i) for i in range(4)]
+    events = []
+
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.stream = AsyncMock(return_value=stream_result(assets, 2))
+    session.execute = AsyncMock()
+    session.rollback = AsyncMock()
+
+    async def slow_commit():
+        events.append("commit start")
+        await asyncio.sleep(0.01)
+        events.append("commit end")
+
+    session.commit = AsyncMock(side_effect=slow_commit)
+
+    async def fake_embeddings(batch):
+        events.append(f"embed {[asset.id for asset in batch]}")
+        await asyncio.sleep(0)
+        return [(asset.id, [float(asset.id)] * 12 + [0.5]) for asset in batch]
+
+    job = EmbedJob()
+    job.BATCH_SIZE = 2
+    job.get_async_session = Mock(return_value=session)
+    job.complete = AsyncMock()
+
+    with patch("src.jobs.embed.batch_update_asset_embeddings", side_effect=fake_embeddings):
+        await job.start()
+
+    assert events.index("embed [2, 3]") < events.index("commit end")
+    assert (job.processed, job.failed, job._commit_count) == (4, 0, 2)
+
+    # A fatal database error stops the producer and fails the job
+    session.commit = AsyncMock(side_effect=Exception("Database error: connection lost"))
+    job.fail = AsyncMock()
+    with patch("src.jobs.embed.batch_update_asset_embeddings", side_effect=fake_embeddings):
+        await job.start()
+    job.fail.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embed_job_fails_when_stream_breaks():
+    """Test that an error while streaming assets fails the job instead of leaving the writer waiting"""
+    assets = [Mock(id=i) for i in range(4)]
+
+    async def partitions():
+        yield assets[:2]
+        raise Exception("connection was closed in the middle of operation")
+
+    stream = Mock()
+    stream.scalars.return_value.partitions = Mock(side_effect=partitions)
+
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.stream = AsyncMock(return_value=stream)
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+
+    async def fake_embeddings(batch):
+        return [(asset.id, [float(asset.id)] * 12 + [0.5]) for asset in batch]
+
+    job = EmbedJob()
+    job.BATCH_SIZE = 2
+    job.get_async_session = Mock(return_value=session)
+    job.complete = AsyncMock()
+    job.fail = AsyncMock()
+
+    with patch("src.jobs.embed.batch_update_asset_embeddings", side_effect=fake_embeddings):
+        await asyncio.wait_for(job.start(), timeout=1)
+
+    job.fail.assert_awaited_once_with("connection was closed in the middle of operation")
+    job.complete.assert_not_awaited()
+
+
+def test_log_embedding_stats():
+    """Test that embedding diagnostics are computed in one vectorized pass"""
+    job = EmbedJob()
+    job.logger = Mock()
+
+    job._log_embedding_stats(1, [0.5, -1.0, 0.5, 2.0])
+    job.logger.debug.assert_any_call("Stats - min: -1.0000, max: 2.0000, mean: 0.5000")
+    job.logger.debug.assert_any_call("Number of unique values in first 128: 3")
+    job.logger.warning.assert_called_once()
+
+
+def test_log_embedding_stats_samples_unique_values():
+    """Test that the diversity check only looks at the leading sample"""
+    job = EmbedJob()
+    job.logger = Mock()
+
+    job._log_embedding_stats(1, [0.0] * 128 + [float(i) for i in range(256)])
+
+    job.logger.debug.assert_any_call("Number of unique values in first 128: 1")
+    job.logger.warning.assert_called_once()
+
+    # Empty embeddings are reported rather than raising
+    job.logger.reset_mock()
+    job._log_embedding_stats(2, [])
+    job.logger.warning.assert_called_once_with("Warning: Empty embedding for asset 2!")
@@ -1,32 +1,17 @@
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from src.jobs.file_search import FileSearchJob
+from src.util.file_search import compile_pattern, required_literal, search_file, search_shard
 from src.util.logging import LogConfig
 from src.models.base import Asset
+import asyncio
+import mmap
 import os
-
-
-@pytest.fixture
-def mock_session():
-    session = Mock()
-
-    # Create mock assets
-    mock_asset1 = Mock(spec=Asset)
-    mock_asset1.local_path = "/path/to/test1.sol"
-    mock_asset2 = Mock(spec=Asset)
-    mock_asset2.local_path = "/path/to/test2.cairo"
-    mock_assets = [mock_asset1, mock_asset2]
-
-    # Set up the chain of mock calls
-    mock_execute = Mock()
-    mock_scalars = Mock()
-    mock_scalars.all.return_value = mock_assets
-    mock_execute.scalars.return_value = mock_scalars
-    session.execute.return_value = mock_execute
-
-    session.__enter__ = Mock(return_value=session)
-    session.__exit__ = Mock(return_value=None)
-    return session
+import re
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Set log level to DEBUG for tests
@@ -66,82 +51,220 @@ def test_extension_filtering(mock_config):
     assert job._should_skip_file("test.jpg")
 
 
-def test_file_content_search(mock_config):
+def test_compiled_pattern_reuse(mock_config):
+    """Test that identical patterns share a compiled regex"""
+    assert compile_pattern("function\\s+transfer") is compile_pattern("function\\s+transfer")
+
+    pattern = compile_pattern("test")
+    job = FileSearchJob(regex_pattern="test", compiled_pattern=pattern)
+    assert job.pattern is pattern
+
+    # Backreferences are not supported by RE2 and must fall back to the re module
+    assert compile_pattern("(\\w)\\1").search(b"contract Pool")
+
+
+def test_compile_pattern_fallback_is_quiet(capfd):
+    """Test that patterns RE2 rejects fall back to re without RE2 logging errors"""
+    assert compile_pattern("(?<=function )transfer").search(b"function transfer")
+    with pytest.raises(re.error):
+        compile_pattern("[")
+    assert "Error parsing" not in capfd.readouterr().err
+
+
+def test_required_literal():
+    """Test extraction of the literal prefilter from a pattern"""
+    assert required_literal("function\\s+transferFrom") == b"transferfrom"
+    assert required_literal("(?:import) .*openzeppelin") == b"openzeppelin"
+    assert required_literal("constructor|initialize") is None
+    assert required_literal("[a-z]+") is None
+
+
+def test_required_literal_posix_class(mock_config, tmp_path):
+    """Test that patterns re and RE2 parse differently are not prefiltered"""
+    test_file = tmp_path / "test.sol"
+    test_file.write_text("contract Token { function transfer() public {} }")
+
+    for regex_pattern in ("[[:space:]]function", "(?i)[[:upper:]]unction"):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert required_literal(regex_pattern) is None
+
+        # Files are only dropped when the compiled pattern itself finds nothing
+        matched = compile_pattern(regex_pattern).search(test_file.read_bytes()) is not None
+        assert bool(search_shard(regex_pattern, [str(test_file)])) == matched
+
+
+def test_literal_prefilter(mock_config, tmp_path):
+    """Test that files without the required literal are skipped case-insensitively"""
+    test_file = tmp_path / "test.sol"
+    test_file.write_text("contract Token { Function Transfer() public {} }")
+
+    job = FileSearchJob(regex_pattern="function\\s+transfer")
+    assert len(search_file(str(test_file), job.pattern, required_literal(job.config["pattern"]))) == 1
+
+    job = FileSearchJob(regex_pattern="function\\s+approve")
+    assert search_file(str(test_file), job.pattern, required_literal(job.config["pattern"])) == []
+
+
+def test_literal_prefilter_large_file(mock_config, tmp_path):
+    """Test that memory-mapped files are prefiltered case-insensitively without being copied"""
+    test_file = tmp_path / "large.sol"
+    test_file.write_bytes(b"// padding\n" * 200_000 + b"Function TRANSFER() public {}\n")
+
+    with patch("src.util.file_search.mmap.mmap", wraps=mmap.mmap) as mapped:
+        assert len(search_file(str(test_file), compile_pattern("function\\s+transfer"), b"function")) == 1
+        assert search_file(str(test_file), compile_pattern("function\\s+approve"), b"approve") == []
+    assert mapped.call_count == 2
+
+
+def test_file_content_search(mock_config, tmp_path):
     """Test file content searching with context"""
-    test_content = "This is a test file.\nIt contains a pattern to match.\nAnd some more content."
+    test_file = tmp_path / "test.sol"
+    test_file.write_text("This is a test file.\nIt contains a pattern to match.\nAnd some more content.")
 
-    # Create a mock file object
-    mock_file = mock_open(read_data=test_content)
+    job = FileSearchJob(regex_pattern="pattern")
+    matches = search_file(str(test_file), job.pattern, required_literal(job.config["pattern"]))
 
-    with (
-        patch("builtins.open", mock_file),
-        patch("src.jobs.file_search.is_binary_file", return_value=False),  # Ensure binary check passes
-    ):
-        job = FileSearchJob(regex_pattern="pattern")
-        matches = job._search_file("test.sol", job.pattern)
+    assert len(matches) == 1
+    match = matches[0]
+    assert "pattern" in match["match"]
+    assert "context" in match
+    assert len(match["context"]) <= 100  # Context should be limited
+    assert match["line"] == 2
 
-        assert len(matches) == 1
-        match = matches[0]
-        assert "pattern" in match["match"]
-        assert "context" in match
-        assert len(match["context"]) <= 100  # Context should be limited
 
+def test_match_offsets_are_characters(mock_config, tmp_path):
+    """Test that match offsets and context count characters, not bytes"""
+    text = "é" * 60 + "\n// Ünïcode pattern " + "ü" * 60
+    test_file = tmp_path / "test.sol"
+    test_file.write_text(text, encoding="utf-8")
 
-@pytest.mark.asyncio
-async def test_binary_file_handling(mock_session, mock_config):
+    (match,) = search_file(str(test_file), compile_pattern("pattern"))
+    start = text.index("pattern")
+    assert (match["start"], match["end"]) == (start, start + len("pattern"))
+    assert match["context"] == text[start - 50 : start + len("pattern") + 50]
+    assert match["line"] == 2
+
+
+def test_large_file_search(mock_config, tmp_path):
+    """Test that memory-mapped large files are searched like small ones"""
+    test_file = tmp_path / "large.sol"
+    test_file.write_bytes(b"// padding\n" * 200_000 + b"function transfer() public {}\n")
+
+    job = FileSearchJob(regex_pattern="function\\s+transfer")
+    matches = search_file(str(test_file), job.pattern, required_literal(job.config["pattern"]))
+
+    assert len(matches) == 1
+    assert matches[0]["match"] == "function transfer"
+    assert matches[0]["line"] == 200_001
+
+
+def test_binary_file_handling(tmp_path):
     """Test handling of binary files"""
+    binary_file = tmp_path / "test.bin"
+    binary_file.write_bytes(b"\x00\x01\x02 test")
+    text_file = tmp_path / "test.sol"
+    text_file.write_text("test content")
+
+    # Binary file should be skipped, text file should be processed
+    results = search_shard("test", [str(binary_file), str(text_file)])
+    assert [file_path for file_path, _ in results] == [str(text_file)]
+
+
+def test_directory_search(mock_config, tmp_path):
+    """Test recursive directory collection and searching"""
+    files = {
+        "test1.sol": b"contract Test { function test() public {} }",
+        "nested/test2.cairo": b"func test() { return (); }",
+        "test3.txt": b"should be skipped",
+        "test4.bin": b"\x00\x01\x02",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+    job = FileSearchJob(regex_pattern="test")
+    collected = job._collect_files(str(tmp_path))
+    matches = search_shard("test", [file_path for file_path, _ in collected])
 
-    def mock_is_binary(file_path):
-        return file_path.endswith(".bin")
+    # Only .sol and .cairo files are collected, and both match
+    assert sorted(size for _, size in collected) == sorted([len(files["test1.sol"]), len(files["nested/test2.cairo"])])
+    file_paths = [file_path for file_path, _ in matches]
+    assert len(file_paths) == 2
+    assert any("test1.sol" in path for path in file_paths)
+    assert any("test2.cairo" in path for path in file_paths)
 
-    with (
-        patch("src.backend.database.DBSessionMixin.get_session", return_value=mock_session),
-        patch("src.jobs.file_search.is_binary_file", side_effect=mock_is_binary),
-        patch("os.path.exists", return_value=True),
-    ):
-        job = FileSearchJob(regex_pattern="test")
 
-        # Binary file should be skipped
-        result = job._search_file("test.bin", job.pattern)
-        assert len(result) == 0
+@pytest.mark.asyncio
+async def test_sharded_search(mock_config, tmp_path):
+    """Test that files are partitioned across worker processes without losing matches"""
+    for i in range(4):
+        (tmp_path / f"contract{i}.sol").write_text(f"contract Test{i} {{ function test() public {{}} }}")
+    (tmp_path / "notes.txt").write_text("test should be skipped")
+
+    asset = Mock(spec=Asset)
+    asset.id = 1
+    asset.local_path = str(tmp_path)
+    asset.source_url = "https://github.com/test/repo"
+    asset.asset_type = "github_repo"
+    asset.project = None
+
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.query.return_value.all.return_value = [asset]
 
-        # Text file should be processed
-        with patch("builtins.open", mock_open(read_data="test content")):
-            result = job._search_file("test.sol", job.pattern)
-            assert len(result) > 0
+    job = FileSearchJob(regex_pattern="function test")
+    job.SHARD_SIZE = 1  # One file per shard
+    job.complete = AsyncMock()
+    job.get_session = Mock(return_value=session)
+
+    await job.start()
+
+    result = job.complete.call_args[0][0]
+    assert result.success
+    matches = result.data["results"][0]["matches"]
+    assert len(matches) == 4
+    assert all(m["file_path"].endswith(".sol") for m in matches)
 
 
 @pytest.mark.asyncio
-async def test_directory_search(mock_config):
-    """Test recursive directory searching"""
-    mock_files = {
-        "test1.sol": "contract Test { function test() public {} }",
-        "test2.cairo": "func test() { return (); }",
-        "test3.txt": "should be skipped",
-        "test4.bin": "binary content",
-    }
+async def test_sharded_search_cancellation(mock_config):
+    """Test that cancelling a sharded search does not block the event loop on unfinished shards"""
+    release = threading.Event()
+    shutdowns = []
 
-    def mock_walk(directory):
-        yield directory, [], list(mock_files.keys())
+    class RecordingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers, mp_context):
+            assert mp_context.get_start_method() == "forkserver"
+            super().__init__(max_workers=max_workers)
 
-    def mock_open_file(file_path, mode="r"):
-        if file_path.endswith(".bin"):
-            return mock_open(read_data=b"\x00\x01\x02")(file_path, mode)
-        basename = os.path.basename(file_path)
-        content = mock_files.get(basename, "")
-        m = mock_open(read_data=content)
-        return m(file_path, mode)
+        def shutdown(self, wait=True, cancel_futures=False):
+            shutdowns.append((wait, cancel_futures))
+            super().shutdown(wait=False, cancel_futures=True)
+
+    def slow_shard(regex_pattern, file_paths, pattern=None):
+        release.wait(5)
+        return []
+
+    job = FileSearchJob(regex_pattern="test")
+    job.SHARD_SIZE = 1
+    files = [(f"/tmp/contract{i}.sol", 1) for i in range(6)]
 
     with (
-        patch("os.walk", side_effect=mock_walk),
-        patch("builtins.open", side_effect=mock_open_file),
-        patch("src.jobs.file_search.is_binary_file", return_value=False),  # Ensure binary check passes
+        patch("src.jobs.file_search.ProcessPoolExecutor", RecordingPool),
+        patch("src.jobs.file_search.os.cpu_count", return_value=2),
+        patch("src.jobs.file_search.search_shard", slow_shard),
     ):
-        job = FileSearchJob(regex_pattern="test")
-        matches = job._search_directory("/test/dir", job.pattern)
-
-        # Should find matches in .sol and .cairo files
-        assert len(matches) == 2
-        file_paths = [match["file_path"] for match in matches]
-        assert any("test1.sol" in path for path in file_paths)
-        assert any("test2.cairo" in path for path in file_paths)
+        task = asyncio.create_task(job._search_files(files))
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        elapsed = time.monotonic() - started
+
+    release.set()
+    assert shutdowns == [(False, True)]
+    assert elapsed < 0.5
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from src.jobs.manager import JobManager
+from src.jobs.manager import JobManager, get_job_manager
 from src.jobs.base import Job, JobStatus, JobResult
 from datetime import datetime
 import asyncio
@@ -493,3 +493,42 @@ async def test_list_jobs_time_filter(job_manager, mock_session):
     # Verify job list
     assert len(jobs) == 1
     assert jobs[0]["id"] == "current-job"
+
+
+@pytest.mark.asyncio
+async def test_stop_times_out_hung_jobs(mock_session):
+    """Test that shutdown does not wait indefinitely for a job that ignores cancellation"""
+    manager = JobManager()
+    manager.initialize()
+    await manager.start()
+    release = asyncio.Event()
+
+    async def hung():
+        try:
+            await asyncio.sleep(60)
+        finally:
+            await release.wait()  # Keeps running after being cancelled
+
+    async def quick():
+        await asyncio.sleep(60)
+
+    hung_task, quick_task = asyncio.create_task(hung()), asyncio.create_task(quick())
+    manager._tasks = {"hung": hung_task, "quick": quick_task}
+    await asyncio.sleep(0)
+
+    with patch.object(JobManager, "STOP_TIMEOUT", 0.05):
+        await asyncio.wait_for(manager.stop(), timeout=1)
+
+    assert not manager._running
+    assert manager._tasks == {}
+    assert quick_task.cancelled()
+    assert not hung_task.done()
+
+    release.set()
+    await asyncio.gather(hung_task, return_exceptions=True)
+
+
+def test_get_job_manager():
+    """Test that get_job_manager returns the process-wide job manager"""
+    assert get_job_manager() is JobManager()
+    assert get_job_manager() is get_job_manager()
@@ -1,4 +1,6 @@
+import asyncio
 import pytest
+import time
 from unittest.mock import Mock, AsyncMock, patch, MagicMock, call
 from src.jobs.proxy_monitor import ProxyMonitorJob
 from src.models.base import Asset, AssetType
@@ -9,21 +11,13 @@ from src.services.telegram import TelegramService
 @pytest.fixture
 def mock_session():
     session = MagicMock()
-    session.__enter__.return_value = session
-    session.__exit__.return_value = None
+    session.__aenter__.return_value = session
+    session.__aexit__.return_value = None
 
-    def add_mock(obj):
-        # Simulate the session tracking the object
-        pass
-
-    def commit_mock():
-        # Simulate the commit applying changes
-        pass
-
-    # Mock the session methods properly
-    session.add = MagicMock(side_effect=add_mock)
-    session.commit = MagicMock(side_effect=commit_mock)
-    session.rollback = MagicMock()
+    # Query results are configured per test through execute().scalars()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
 
     return session
 
@@ -40,10 +34,13 @@ def mock_telegram():
 @pytest.fixture
 def proxy_monitor(mock_session, mock_telegram):
     with patch("src.jobs.proxy_monitor.fetch_verified_sources", new_callable=AsyncMock):
+        ProxyMonitorJob._events_cache.clear()
         job = ProxyMonitorJob()
-        job.get_session = Mock(return_value=mock_session)
+        job.get_async_session = Mock(return_value=mock_session)
         job.explorer = Mock()
+        job.explorer.aclose = AsyncMock()
         job.handler_registry = Mock()
+        job.handler_registry.trigger_events = AsyncMock()
         job.logger = Mock()
         yield job
 
@@ -58,7 +55,7 @@ async def test_proxy_monitor_marks_non_proxy(proxy_monitor, mock_session):
         is_proxy=False,
         checked_for_proxy=False,
     )
-    mock_session.query.return_value.filter.return_value.all.return_value = [contract]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [contract]
     proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(return_value=[])
 
     await proxy_monitor.start()
@@ -86,8 +83,8 @@ async def test_proxy_monitor_handles_upgrade(proxy_monitor, mock_session):
         is_proxy=True,
         checked_for_proxy=True,
     )
-    mock_session.query.return_value.filter.return_value.all.return_value = [proxy]
-    mock_session.query.return_value.filter.return_value.first.return_value = None
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [proxy]
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
 
     # Mock explorer responses
     proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
@@ -116,8 +113,8 @@ async def test_proxy_monitor_handles_first_implementation(proxy_monitor, mock_se
         is_proxy=False,
         checked_for_proxy=False,
     )
-    mock_session.query.return_value.filter.return_value.all.return_value = [proxy]
-    mock_session.query.return_value.filter.return_value.first.return_value = None
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [proxy]
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
 
     # Mock explorer responses
     proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
@@ -144,14 +141,281 @@ async def test_proxy_monitor_handles_errors(proxy_monitor, mock_session):
         is_proxy=False,
         checked_for_proxy=False,
     )
-    mock_session.query.return_value.filter.return_value.all.return_value = [contract]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [contract]
     proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(side_effect=Exception("API Error"))
 
     # Run job
     await proxy_monitor.start()
 
-    # Verify error was handled
-    assert mock_session.rollback.called
+    # Verify error was handled without committing or tearing down the session
+    mock_session.commit.assert_not_awaited()
+    mock_session.rollback.assert_not_awaited()
     assert contract.checked_for_proxy is False
     assert contract.is_proxy is False
     assert "implementation_history" not in contract.extra_data
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_rolls_back_savepoint(proxy_monitor, mock_session):
+    """Test that a failure while recording the implementation only rolls back that contract's savepoint"""
+    proxy = Asset(
+        identifier="https://etherscan.io/address/0x123",
+        asset_type=AssetType.DEPLOYED_CONTRACT,
+        extra_data={},
+        project_id=1,
+        is_proxy=True,
+        checked_for_proxy=True,
+    )
+    other = Asset(
+        identifier="https://etherscan.io/address/0xabc",
+        asset_type=AssetType.DEPLOYED_CONTRACT,
+        extra_data={},
+        is_proxy=False,
+        checked_for_proxy=False,
+    )
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [proxy, other]
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
+
+    proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
+    proxy_monitor.explorer.EXPLORERS = {"etherscan": {"domain": "etherscan.io"}}
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(
+        side_effect=[[{"implementation": "0x456", "blockNumber": 1234, "timestamp": 1234567890}], []]
+    )
+
+    with patch(
+        "src.jobs.proxy_monitor.fetch_verified_sources", new_callable=AsyncMock, side_effect=Exception("Download failed")
+    ):
+        await proxy_monitor.start()
+
+    # The failed savepoint saw the exception, and the next contract was still processed
+    savepoint_exits = mock_session.begin_nested.return_value.__aexit__.await_args_list
+    assert any(call.args[0] is Exception for call in savepoint_exits)
+    assert other.checked_for_proxy is True
+    mock_session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_caches_events(proxy_monitor, mock_session):
+    """Test that a repeat run reuses upgrade events and skips unchanged writes"""
+    contract = Asset(
+        identifier="https://etherscan.io/address/0x123",
+        asset_type=AssetType.DEPLOYED_CONTRACT,
+        extra_data={},
+        is_proxy=False,
+        checked_for_proxy=False,
+    )
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [contract]
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(return_value=[])
+
+    await proxy_monitor.start()
+    await proxy_monitor.start()
+
+    proxy_monitor.explorer.get_proxy_upgrade_events.assert_awaited_once()
+    assert mock_session.commit.await_count == 1
+
+    # Expired entries are fetched again
+    with patch("src.jobs.proxy_monitor.time.monotonic", return_value=time.monotonic() + ProxyMonitorJob.EVENTS_CACHE_TTL):
+        await proxy_monitor.start()
+    assert proxy_monitor.explorer.get_proxy_upgrade_events.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_evicts_stale_events(proxy_monitor):
+    """Test that superseded and expired cache entries do not accumulate"""
+    contract = Asset(identifier="https://etherscan.io/address/0x123", extra_data={})
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(return_value=[])
+    ProxyMonitorJob._events_cache["https://etherscan.io/address/0xold"] = (
+        time.monotonic() - ProxyMonitorJob.EVENTS_CACHE_TTL,
+        None,
+        [],
+    )
+
+    await proxy_monitor._fetch_all_upgrade_events([contract])
+    assert list(ProxyMonitorJob._events_cache) == [contract.identifier]
+
+    # A newly recorded upgrade replaces the contract's entry instead of adding one
+    contract.extra_data = {"implementation_history": [{"block_number": 1234}]}
+    await proxy_monitor._fetch_all_upgrade_events([contract])
+    assert ProxyMonitorJob._events_cache[contract.identifier][1] == 1234
+    assert len(ProxyMonitorJob._events_cache) == 1
+    assert proxy_monitor.explorer.get_proxy_upgrade_events.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_fetches_concurrently(proxy_monitor, mock_session):
+    """Test that explorer calls overlap up to the concurrency limit and a failure only affects its contract"""
+    contracts = [
+        Asset(
+            identifier=f"https://etherscan.io/address/0x{i}",
+            asset_type=AssetType.DEPLOYED_CONTRACT,
+            extra_data={},
+            is_proxy=False,
+            checked_for_proxy=False,
+        )
+        for i in range(6)
+    ]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = contracts
+
+    running = 0
+    peak = 0
+
+    async def get_events(identifier):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if identifier.endswith("0x3"):
+            raise Exception("API Error")
+        return []
+
+    proxy_monitor.MAX_CONCURRENT_FETCHES = 3
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(side_effect=get_events)
+
+    await proxy_monitor.start()
+
+    assert peak == 3
+    assert [c.checked_for_proxy for c in contracts] == [True, True, True, False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_reuses_loaded_implementations(proxy_monitor, mock_session):
+    """Test that implementation assets already loaded or just created are not queried again"""
+    impl = Asset(
+        identifier="https://etherscan.io/address/0x456",
+        asset_type=AssetType.DEPLOYED_CONTRACT,
+        extra_data={},
+        is_proxy=False,
+        checked_for_proxy=False,
+    )
+    proxies = [
+        Asset(
+            identifier=f"https://etherscan.io/address/0x{i}",
+            asset_type=AssetType.DEPLOYED_CONTRACT,
+            extra_data={},
+            project_id=1,
+            is_proxy=True,
+            checked_for_proxy=True,
+        )
+        for i in range(2)
+    ]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [impl] + proxies
+
+    proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
+    proxy_monitor.explorer.EXPLORERS = {"etherscan": {"domain": "etherscan.io"}}
+
+    async def get_events(identifier):
+        if identifier == impl.identifier:
+            return []
+        return [{"implementation": "0x456", "blockNumber": 1234, "timestamp": 1234567890}]
+
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(side_effect=get_events)
+
+    await proxy_monitor.start()
+
+    assert all(proxy.implementation is impl for proxy in proxies)
+    assert mock_session.execute.await_count == 2  # The contract query and the non-proxy update, no lookups
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_batches_commits(proxy_monitor, mock_session):
+    """Test that contract updates share commits and upgrade events wait for their batch"""
+    old_impl = Asset(identifier="https://etherscan.io/address/0x789", asset_type=AssetType.DEPLOYED_CONTRACT)
+    proxies = [
+        Asset(
+            identifier=f"https://etherscan.io/address/0x{i}",
+            asset_type=AssetType.DEPLOYED_CONTRACT,
+            extra_data={},
+            implementation=old_impl,
+            project_id=1,
+            is_proxy=True,
+            checked_for_proxy=True,
+        )
+        for i in range(3)
+    ]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = proxies
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
+
+    proxy_monitor.COMMIT_BATCH_SIZE = 2
+    proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
+    proxy_monitor.explorer.EXPLORERS = {"etherscan": {"domain": "etherscan.io"}}
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(
+        return_value=[{"implementation": "0x456", "blockNumber": 1234, "timestamp": 1234567890}]
+    )
+
+    await proxy_monitor.start()
+
+    assert mock_session.commit.await_count == 2
+    batches = [call.args[0] for call in proxy_monitor.handler_registry.trigger_events.await_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(trigger == HandlerTrigger.CONTRACT_UPGRADED for batch in batches for trigger, _ in batch)
+
+
+def test_extra_data_tracks_mutations():
+    """Test that in-place extra_data updates mark the asset as modified"""
+    from sqlalchemy import inspect
+    from sqlalchemy.orm.attributes import set_committed_value
+
+    asset = Asset(identifier="https://etherscan.io/address/0x123", asset_type=AssetType.DEPLOYED_CONTRACT)
+    set_committed_value(asset, "extra_data", {"revision": 1})
+    asset.extra_data["revision"] = 2
+
+    assert inspect(asset).attrs.extra_data.history.has_changes()
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_resolves_explorer_once_per_host(proxy_monitor, mock_session):
+    """Test that the explorer for a host is looked up once and reused for its other contracts"""
+    proxies = [
+        Asset(
+            identifier=f"https://etherscan.io/address/0x{i}",
+            asset_type=AssetType.DEPLOYED_CONTRACT,
+            extra_data={},
+            project_id=1,
+            is_proxy=True,
+            checked_for_proxy=True,
+        )
+        for i in range(3)
+    ]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = proxies
+    mock_session.execute.return_value.scalars.return_value.first.return_value = None
+
+    proxy_monitor.config = Mock(data_dir="/data")
+    proxy_monitor.explorer.is_supported_explorer = Mock(return_value=(True, "etherscan"))
+    proxy_monitor.explorer.EXPLORERS = {"etherscan": {"domain": "etherscan.io"}}
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(
+        return_value=[{"implementation": "0x456", "blockNumber": 1234, "timestamp": 1234567890}]
+    )
+
+    with patch("src.jobs.proxy_monitor.fetch_verified_sources", new_callable=AsyncMock) as fetch:
+        await proxy_monitor.start()
+
+    proxy_monitor.explorer.is_supported_explorer.assert_called_once()
+    fetch.assert_awaited_once_with("https://etherscan.io/address/0x456", "/data/1/etherscan.io/address/0x456")
+    assert all(proxy.implementation.identifier == "https://etherscan.io/address/0x456" for proxy in proxies)
+
+
+@pytest.mark.asyncio
+async def test_proxy_monitor_bulk_marks_non_proxies(proxy_monitor, mock_session):
+    """Test that all non-proxies are marked with one UPDATE in the final commit"""
+    contracts = [
+        Asset(
+            id=i,
+            identifier=f"https://etherscan.io/address/0x{i}",
+            asset_type=AssetType.DEPLOYED_CONTRACT,
+            extra_data={},
+            is_proxy=i == 2,  # A former proxy whose upgrade events are gone
+            checked_for_proxy=i == 2,
+        )
+        for i in range(3)
+    ]
+    mock_session.execute.return_value.scalars.return_value.all.return_value = contracts
+    proxy_monitor.explorer.get_proxy_upgrade_events = AsyncMock(return_value=[])
+
+    await proxy_monitor.start()
+
+    statement = mock_session.execute.await_args_list[-1].args[0]
+    assert statement.is_update
+    assert statement.compile().params["id_1"] == [0, 1, 2]
+    mock_session.commit.assert_awaited_once()
+    assert all(c.checked_for_proxy is True and c.is_proxy is False for c in contracts)
@@ -1,4 +1,6 @@
 import pytest
+import shlex
+import sys
 from src.util.command_parser import CommandParser
 from src.actions.base import ActionSpec, ActionArgument
 
@@ -44,6 +46,16 @@ def test_parse_command():
     assert cmd == "test"
     assert args == ""
 
+    # Test empty and blank messages
+    assert parser.parse_command("") == ("", "")
+    assert parser.parse_command("/") == ("", "")
+    assert parser.parse_command("  \n") == ("", "")
+
+    # Test command names are interned and arguments may start on the next line
+    cmd, args = parser.parse_command("".join(["/sea", "rch"]) + "\npattern=test")
+    assert cmd is sys.intern("search")
+    assert args == "pattern=test"
+
 
 def test_validate_arguments():
     """Test argument validation"""
@@ -72,3 +84,30 @@ def test_validate_arguments():
     # Test unknown argument
     with pytest.raises(ValueError, match="Unknown parameters"):
         parser.validate_arguments({"required": "value", "unknown": "value"}, spec)
+
+
+def test_parse_arguments_fast_path():
+    """Test that unquoted arguments skip shlex but parse the same way"""
+    parser = CommandParser()
+
+    assert parser.parse_arguments("arg1  arg2\targ3") == ["arg1", "arg2", "arg3"]
+    assert parser.parse_arguments("pattern=test project=1 2") == {"pattern": "test", "project": "1 2"}
+
+    # Quotes and escapes still go through shlex
+    assert parser.parse_arguments('"arg 1" arg\\ 2') == ["arg 1", "arg 2"]
+
+    # Whitespace shlex does not split on, like the NBSP some clients send, stays in the argument
+    for args_str in ("\n\xa0a", "arg1\xa0arg2 arg3", "a\x0bb\x0c c\u2000", "key=a\xa0b"):
+        expected = shlex.split(args_str, posix=True)
+        if "=" in args_str:
+            expected = parser._parse_key_values(expected)
+        assert parser.parse_arguments(args_str) == expected
+
+
+def test_parse_arguments_key_value_detection():
+    """Test that only equals signs outside quotes switch to key=value parsing"""
+    parser = CommandParser()
+
+    assert parser.parse_arguments('"x=1" y') == ["x=1", "y"]
+    assert parser.parse_arguments("a=1 b 'c=d'") == {"a": "1 b", "c": "d"}
+    assert parser.parse_arguments('q="a b" r=2 3') == {"q": "a b", "r": "2 3"}
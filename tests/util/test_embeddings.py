@@ -0,0 +1,16 @@
+from unittest.mock import MagicMock
+from src.util.embeddings import update_embedding_raw
+
+
+def test_update_embedding_raw_binds_embedding():
+    """Test that the embedding update binds the vector instead of formatting it into the SQL"""
+    session = MagicMock()
+
+    update_embedding_raw(session, 1, [0.5, -1.0])
+    update_embedding_raw(session, 7, [0.25, 2.0])
+
+    (first_sql, first_params), (second_sql, second_params) = [call.args for call in session.execute.call_args_list]
+    assert str(first_sql) == str(second_sql) == "UPDATE assets SET embedding = CAST(:embedding AS vector) WHERE id = :id"
+    assert set(first_sql.compile().params) == {"embedding", "id"}  # Both are parsed as bind parameters
+    assert first_params == {"id": 1, "embedding": "[0.5,-1.0]"}
+    assert second_params == {"id": 7, "embedding": "[0.25,2.0]"}
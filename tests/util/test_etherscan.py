@@ -1,8 +1,8 @@
 import json
 import os
 import pytest
-from unittest.mock import patch, Mock
-from src.util.etherscan import fetch_verified_sources, ExplorerType
+from unittest.mock import patch, Mock, AsyncMock
+from src.util.etherscan import fetch_verified_sources, EVMExplorer, ExplorerType
 
 
 @pytest.fixture
@@ -175,3 +175,72 @@ async def test_path_traversal_prevention(tmp_path, mock_config):
                 # Verify no files were created
                 assert not os.path.exists(os.path.join(target_path, malicious_path))
                 assert len(os.listdir(target_path)) == 0, "No files should be created when path traversal is detected"
+
+
+@pytest.mark.asyncio
+async def test_explorer_reuses_session():
+    """Test that explorer requests share one HTTP session until it is closed"""
+    block_response = {"status": "1", "result": {"timeStamp": "1234567890"}}
+    http_session = MockClientSession(block_response)
+    http_session.closed = False
+    http_session.close = AsyncMock()
+
+    explorer = EVMExplorer()
+    with (
+        patch("src.util.etherscan.aiohttp.TCPConnector") as connector,
+        patch("src.util.etherscan.aiohttp.ClientSession", return_value=http_session) as client_session,
+    ):
+        for block_number in range(3):
+            assert await explorer._get_block_timestamp(ExplorerType.ETHERSCAN, block_number, "key") == "1234567890"
+
+        client_session.assert_called_once()
+        connector.assert_called_once_with(limit=EVMExplorer.MAX_CONNECTIONS, ttl_dns_cache=EVMExplorer.DNS_CACHE_TTL)
+
+        await explorer.aclose()
+        http_session.close.assert_awaited_once()
+        await explorer.aclose()  # Closing again is a no-op
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"},
+        {"status": "0", "message": "NOTOK", "result": "Invalid API Key"},
+    ],
+)
+async def test_upgrade_events_raise_on_explorer_errors(response):
+    """Test that failed explorer requests raise instead of looking like contracts without upgrades"""
+    explorer = EVMExplorer()
+    explorer.is_supported_explorer = Mock(return_value=(True, ExplorerType.ETHERSCAN))
+    explorer.get_api_key = Mock(return_value="key")
+    explorer._get_json = AsyncMock(return_value=response)
+
+    with pytest.raises(RuntimeError, match=response["result"]):
+        await explorer.get_proxy_upgrade_events("https://etherscan.io/address/0x123")
+
+    # An empty result is still a valid answer
+    explorer._get_json = AsyncMock(return_value={"status": "0", "message": "No records found", "result": []})
+    assert await explorer.get_proxy_upgrade_events("https://etherscan.io/address/0x123") == []
+
+
+@pytest.mark.asyncio
+async def test_explorer_throttles_requests():
+    """Test that no more than REQUESTS_PER_SECOND requests start within any second"""
+    clock = [100.0]
+    started = []
+
+    async def fake_sleep(seconds):
+        clock[0] += seconds
+
+    explorer = EVMExplorer()
+    explorer.REQUESTS_PER_SECOND = 2
+    with (
+        patch("src.util.etherscan.time.monotonic", side_effect=lambda: clock[0]),
+        patch("src.util.etherscan.asyncio.sleep", side_effect=fake_sleep),
+    ):
+        for _ in range(5):
+            await explorer._throttle()
+            started.append(clock[0])
+
+    assert started == [100.0, 100.0, 101.0, 101.0, 102.0]